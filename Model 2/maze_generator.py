@@ -1,12 +1,16 @@
 import random
 
-def generate_maze(rows, cols, density=0.1):
+def generate_maze(rows, cols, density=0.1, seed=None):
     """
     Generates a random maze using Recursive Backtracking.
     rows, cols: Dimensions of the maze (should be odd numbers for best results).
     density: Chance (0.0 to 1.0) to remove random walls after generation 
     to create loops (multiple paths).
+    seed: Optional seed; the same seed always gives the same maze.
     """
+    # Private generator so seeding never touches the global random module
+    rng = random.Random(seed)
+
     # 1. Initialize grid with all walls (1)
     # Ensure dimensions are odd to allow for walls between cells
     if rows % 2 == 0: rows += 1
@@ -22,7 +26,7 @@ def generate_maze(rows, cols, density=0.1):
             nr, nc = r + dr, c + dc
             if 0 <= nr < rows and 0 <= nc < cols:
                 neighbors.append((nr, nc))
-        random.shuffle(neighbors)
+        rng.shuffle(neighbors)
         return neighbors
 
     # 2. Recursive Backtracking to carve paths
@@ -57,7 +61,7 @@ def generate_maze(rows, cols, density=0.1):
         for c in range(1, cols - 1):
             if maze[r][c] == 1: # If it's a wall
                 # Randomly remove it to create a shortcut/loop
-                if random.random() < density:
+                if rng.random() < density:
                     maze[r][c] = 0
 
     # Ensure start and end are open
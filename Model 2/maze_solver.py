@@ -1,160 +1,220 @@
 import heapq
+from array import array
 from collections import deque
 import maze_generator  # Imports the generator file you just made
 
-# ---------------------------------------------------------
-# SETUP: Generate a Random Maze
-# ---------------------------------------------------------
-# We use odd numbers for dimensions because the generator works best that way
-ROWS, COLS = 21, 21 
-# Generate a fresh maze
-MAZE = maze_generator.generate_maze(ROWS, COLS, density=0.05)
-
-START = (0, 0)
-GOAL = (ROWS - 1, COLS - 1)
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
 
 # Helper to visualize the path in the terminal
-def print_path(path, title):
-    # Create a copy of the maze for printing
-    display_maze = [[' ' if cell == 0 else '#' for cell in row] for row in MAZE]
-    
-    path_len = 0
-    if path:
-        path_len = len(path)
-        for (r, c) in path:
-            # Don't overwrite Start/Goal markers
-            if (r, c) != START and (r, c) != GOAL:
-                display_maze[r][c] = '.'
-    
-    display_maze[START[0]][START[1]] = 'S'
-    display_maze[GOAL[0]][GOAL[1]] = 'E'
-    
+def print_path(maze, path, title, start, goal):
     print(f"\n--- {title} ---")
     if not path:
         print("No path found!")
         return
 
-    print(f"Path Length: {path_len} steps")
-    print("-" * (COLS * 2 + 2))
-    for row in display_maze:
-        print("|" + " ".join(row) + "|")
-    print("-" * (COLS * 2 + 2))
-
-# Helper to find valid neighbors
-def get_neighbors(r, c):
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    for dr, dc in directions:
-        nr, nc = r + dr, c + dc
-        if 0 <= nr < ROWS and 0 <= nc < COLS and MAZE[nr][nc] == 0:
-            yield (nr, nc)
-
-# ---------------------------------------------------------
-# 1. Depth-First Search (DFS)
-# ---------------------------------------------------------
-def solve_dfs():
-    stack = [START]
-    visited = set()
-    parent = {}
-
-    visited.add(START)
-
-    while stack:
-        current = stack.pop()
-        
-        if current == GOAL:
-            break
-
-        for neighbor in get_neighbors(*current):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                parent[neighbor] = current
-                stack.append(neighbor)
-    
-    return reconstruct_path(parent)
-
-# ---------------------------------------------------------
-# 2. Breadth-First Search (BFS)
-# ---------------------------------------------------------
-def solve_bfs():
-    queue = deque([START])
-    visited = set()
-    parent = {}
-
-    visited.add(START)
-
-    while queue:
-        current = queue.popleft()
-
-        if current == GOAL:
-            break
-
-        for neighbor in get_neighbors(*current):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                parent[neighbor] = current
-                queue.append(neighbor)
-    
-    return reconstruct_path(parent)
+    # Group the path by row so each row is built on its own (no full copy of the maze)
+    # Start/Goal markers are added last so the path never overwrites them
+    marks = {}
+    for (r, c) in path:
+        marks.setdefault(r, {})[c] = '.'
+    marks.setdefault(start[0], {})[start[1]] = 'S'
+    marks.setdefault(goal[0], {})[goal[1]] = 'E'
+
+    cols = len(maze[0])
+    print(f"Path Length: {len(path)} steps")
+    print("-" * (cols * 2 + 2))
+    for r, row in enumerate(maze):
+        row_marks = marks.get(r, {})
+        print("|" + " ".join(row_marks.get(c, ' ' if cell == 0 else '#') for c, cell in enumerate(row)) + "|")
+    print("-" * (cols * 2 + 2))
 
 # ---------------------------------------------------------
-# 3. A* Search (A-Star)
+# Solver Engine
 # ---------------------------------------------------------
-def heuristic(a, b):
-    # Manhattan distance
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-def solve_astar():
-    pq = []
-    heapq.heappush(pq, (0, START))
-    
-    parent = {}
-    g_score = {START: 0}
+class MazeSolver:
+    """
+    Built once per maze, then answers DFS / BFS / A* queries between any
+    two open cells.
+    Cells are numbered r * cols + c. The open neighbors of every cell are
+    precomputed in CSR form: the neighbors of cell i are
+    adj[offsets[i]:offsets[i + 1]], in Up, Down, Left, Right order,
+    so the searches never re-check bounds or walls.
+    After each search, expanded holds the number of cells it took off the
+    frontier (including the goal).
+    """
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.rows = len(maze)
+        self.cols = len(maze[0])
+
+        rows, cols = self.rows, self.cols
+        offsets = array('i', [0])
+        adj = array('i')
+        for r in range(rows):
+            row = maze[r]
+            for c in range(cols):
+                if row[c] == 0:
+                    for dr, dc in DIRECTIONS:
+                        nr, nc = r + dr, c + dc
+                        if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 0:
+                            adj.append(nr * cols + nc)
+                offsets.append(len(adj))
+        self.offsets = offsets
+        self.adj = adj
+        self.expanded = 0
+
+    def index(self, cell):
+        r, c = cell
+        if not (0 <= r < self.rows and 0 <= c < self.cols) or self.maze[r][c] != 0:
+            raise ValueError(f"{cell} is not an open cell of the maze")
+        return r * self.cols + c
+
+    def neighbors(self, i):
+        return self.adj[self.offsets[i]:self.offsets[i + 1]]
+
+    # ---------------------------------------------------------
+    # 1. Depth-First Search (DFS)
+    # ---------------------------------------------------------
+    def dfs(self, start, goal):
+        s, g = self.index(start), self.index(goal)
+        offsets, adj = self.offsets, self.adj
+        parent = array('i', [-1]) * (self.rows * self.cols) # To reconstruct path
+        visited = bytearray(self.rows * self.cols)
+
+        stack = [s]
+        visited[s] = 1
+        expanded = 0
+
+        while stack:
+            current = stack.pop() # LIFO behavior
+            expanded += 1
+
+            if current == g:
+                break
+
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = adj[k]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    parent[neighbor] = current
+                    stack.append(neighbor)
+
+        self.expanded = expanded
+        return self.reconstruct_path(parent, s, g)
+
+    # ---------------------------------------------------------
+    # 2. Breadth-First Search (BFS)
+    # ---------------------------------------------------------
+    def bfs(self, start, goal):
+        s, g = self.index(start), self.index(goal)
+        offsets, adj = self.offsets, self.adj
+        parent = array('i', [-1]) * (self.rows * self.cols)
+        visited = bytearray(self.rows * self.cols)
+
+        queue = deque([s])
+        visited[s] = 1
+        expanded = 0
+
+        while queue:
+            current = queue.popleft() # FIFO behavior
+            expanded += 1
+
+            if current == g:
+                break
+
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = adj[k]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    parent[neighbor] = current
+                    queue.append(neighbor)
+
+        self.expanded = expanded
+        return self.reconstruct_path(parent, s, g)
+
+    # ---------------------------------------------------------
+    # 3. A* Search (A-Star)
+    # ---------------------------------------------------------
+    def astar(self, start, goal):
+        s, g = self.index(start), self.index(goal)
+        offsets, adj, cols = self.offsets, self.adj, self.cols
+        goal_r, goal_c = goal
+        parent = array('i', [-1]) * (self.rows * cols)
+        inf = self.rows * cols # Longer than any real path
+        g_score = array('i', [inf]) * (self.rows * cols) # Cost from start to current node
+        g_score[s] = 0
+
+        # Priority Queue stores tuples: (f_score, current_node)
+        pq = [(0, s)]
+        expanded = 0
+
+        while pq:
+            _, current = heapq.heappop(pq) # Get node with lowest f_score
+            expanded += 1
+
+            if current == g:
+                break
 
-    while pq:
-        _, current = heapq.heappop(pq)
-
-        if current == GOAL:
-            break
-
-        for neighbor in get_neighbors(*current):
             new_g_score = g_score[current] + 1
-            
-            if new_g_score < g_score.get(neighbor, float('inf')):
-                g_score[neighbor] = new_g_score
-                f_score = new_g_score + heuristic(neighbor, GOAL)
-                heapq.heappush(pq, (f_score, neighbor))
-                parent[neighbor] = current
-
-    return reconstruct_path(parent)
-
-def reconstruct_path(parent):
-    path = []
-    current = GOAL
-    if current not in parent:
-        return None
-    while current != START:
-        path.append(current)
-        current = parent[current]
-    path.append(START)
-    path.reverse()
-    return path
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = adj[k]
+
+                # If we found a better path to this neighbor
+                if new_g_score < g_score[neighbor]:
+                    g_score[neighbor] = new_g_score
+                    # Manhattan distance: |x1 - x2| + |y1 - y2|
+                    nr, nc = divmod(neighbor, cols)
+                    f_score = new_g_score + abs(nr - goal_r) + abs(nc - goal_c)
+                    heapq.heappush(pq, (f_score, neighbor))
+                    parent[neighbor] = current
+
+        self.expanded = expanded
+        return self.reconstruct_path(parent, s, g)
+
+    # ---------------------------------------------------------
+    # Helper to backtrack from Goal to Start using the parent array
+    # ---------------------------------------------------------
+    def reconstruct_path(self, parent, s, g):
+        if s == g:
+            return [divmod(s, self.cols)]
+        if parent[g] == -1:
+            return None # Goal never reached
+
+        path = []
+        current = g
+        while current != s:
+            path.append(divmod(current, self.cols))
+            current = parent[current]
+        path.append(divmod(s, self.cols))
+        path.reverse()
+        return path
 
 # ---------------------------------------------------------
 # Main Execution
 # ---------------------------------------------------------
 if __name__ == "__main__":
+    # We use odd numbers for dimensions because the generator works best that way
+    ROWS, COLS = 21, 21
+    # Generate a fresh maze
+    MAZE = maze_generator.generate_maze(ROWS, COLS, density=0.05)
+
+    START = (0, 0)
+    GOAL = (ROWS - 1, COLS - 1)
+    solver = MazeSolver(MAZE)
+
     print(f"Generated Random Maze Size: {ROWS}x{COLS}")
-    
+
     # Show empty maze first
     print("\n--- The Maze ---")
     for row in MAZE:
         print(" ".join([' ' if c == 0 else '#' for c in row]))
 
     # Run algorithms
-    dfs_path = solve_dfs()
-    bfs_path = solve_bfs()
-    astar_path = solve_astar()
+    dfs_path = solver.dfs(START, GOAL)
+    bfs_path = solver.bfs(START, GOAL)
+    astar_path = solver.astar(START, GOAL)
 
-    print_path(dfs_path, "DFS (Depth-First)")
-    print_path(bfs_path, "BFS (Breadth-First)")
-    print_path(astar_path, "A* (A-Star)")
\ No newline at end of file
+    print_path(MAZE, dfs_path, "DFS (Depth-First)", START, GOAL)
+    print_path(MAZE, bfs_path, "BFS (Breadth-First)", START, GOAL)
+    print_path(MAZE, astar_path, "A* (A-Star)", START, GOAL)
@@ -1,21 +1,24 @@
 import time
 import heapq
 
+from algorithms.path_utils import reconstruct_path
+
 def heuristic(a, b):
     """Calculates Manhattan distance between two points a and b."""
     # a and b are (r, c) tuples
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
-def astar_solve(maze, start, goal):
+def astar_solve(maze, start, goal, stats=None):
     """
     A* that records steps when nodes are expanded (popped from open set).
     Returns (steps, path, real_time)
     steps: ("visit", (r,c))
+    stats: optional SolveStats to fill with search counters and phase timings.
     """
     rows = len(maze)
     cols = len(maze[0])
 
-    t0 = time.time()
+    t0 = time.perf_counter()
 
     # open_heap stores (f_score, g_score, coordinates)
     # The lowest f_score is popped first
@@ -27,12 +30,18 @@ def astar_solve(maze, start, goal):
     steps = []
 
     found = False
+    track = stats is not None
+    peak = 1
+    stale = 0
 
     while open_heap:
+        if track and len(open_heap) > peak:
+            peak = len(open_heap)
         f, g, current = heapq.heappop(open_heap)
         
         # If the node was already processed via a better path (in closed set)
         if current in closed:
+            stale += 1
             continue
 
         closed.add(current)
@@ -57,24 +66,21 @@ def astar_solve(maze, start, goal):
                     f_score = tentative_g + heuristic(neighbor, goal)
                     heapq.heappush(open_heap, (f_score, tentative_g, neighbor))
 
-    t1 = time.time()
+    t1 = time.perf_counter()
     real_time = t1 - t0
 
+    if track:
+        # Every pop either expands a node or skips a stale entry;
+        # whatever was pushed but never popped is still in the heap
+        stats.nodes_expanded = len(closed)
+        stats.stale_skips = stale
+        stats.pops = len(closed) + stale
+        stats.pushes = stats.pops + len(open_heap)
+        stats.peak_frontier = peak
+        stats.search_time = real_time
+
     if not found:
         return steps, None, real_time
 
-    # Reconstruct path
-    path = []
-    cur = goal
-    # Safety check for path reconstruction
-    while cur != start and cur in parent:
-        path.append(cur)
-        cur = parent[cur]
-    
-    if cur == start:
-        path.append(start)
-        path.reverse()
-        return steps, path, real_time
-    else:
-        # Should not happen if found is True, but good practice
-        return steps, None, real_time
\ No newline at end of file
+    path = reconstruct_path(parent, start, goal, stats)
+    return steps, path, real_time
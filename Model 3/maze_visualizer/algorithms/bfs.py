@@ -1,16 +1,19 @@
 import time
 from collections import deque
 
-def bfs_solve(maze, start, goal):
+from algorithms.path_utils import reconstruct_path
+
+def bfs_solve(maze, start, goal, stats=None):
     """
     BFS that records steps for visualization.
     Returns (steps, path, real_time)
     steps actions: ("visit", (r,c))
+    stats: optional SolveStats to fill with search counters and phase timings.
     """
     rows = len(maze)
     cols = len(maze[0])
 
-    t0 = time.time()
+    t0 = time.perf_counter()
 
     visited = set([start])
     parent = {}
@@ -19,8 +22,12 @@ def bfs_solve(maze, start, goal):
     q = deque([start])
 
     found = False
+    track = stats is not None
+    peak = 1
 
     while q:
+        if track and len(q) > peak:
+            peak = len(q)
         current = q.popleft()
         steps.append(("visit", current)) # Record visit upon popping (consistent with A*)
         
@@ -36,22 +43,20 @@ def bfs_solve(maze, start, goal):
                 parent[neighbor] = current
                 q.append(neighbor)
 
-    t1 = time.time()
+    t1 = time.perf_counter()
     real_time = t1 - t0
 
+    if track:
+        # Every visited cell was queued once; every recorded step was one pop
+        stats.nodes_expanded = len(steps)
+        stats.pops = len(steps)
+        stats.pushes = len(visited)
+        stats.peak_frontier = peak
+        stats.search_time = real_time
+
     if not found:
         return steps, None, real_time
 
     # Reconstruct path
-    path = []
-    cur = goal
-    while cur != start and cur in parent:
-        path.append(cur)
-        cur = parent[cur]
-    
-    if cur == start:
-        path.append(start)
-        path.reverse()
-        return steps, path, real_time
-    else:
-        return steps, None, real_time
\ No newline at end of file
+    path = reconstruct_path(parent, start, goal, stats)
+    return steps, path, real_time
@@ -1,15 +1,18 @@
 import time
 
-def dfs_solve(maze, start, goal):
+from algorithms.path_utils import reconstruct_path
+
+def dfs_solve(maze, start, goal, stats=None):
     """
     DFS that records steps for visualization using an explicit stack.
     Returns (steps, path, real_time)
     steps actions: ("visit", (r,c)), ("backtrack", (r,c))
+    stats: optional SolveStats to fill with search counters and phase timings.
     """
     rows = len(maze)
     cols = len(maze[0])
 
-    t0 = time.time()
+    t0 = time.perf_counter()
 
     parent = {}
     visited = set([start])
@@ -20,6 +23,8 @@ def dfs_solve(maze, start, goal):
     steps.append(("visit", start))
 
     found = False
+    track = stats is not None
+    peak = 1
 
     def get_neighbors(r, c):
         for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
@@ -49,27 +54,27 @@ def dfs_solve(maze, start, goal):
             visited.add(next_cell)
             steps.append(("visit", next_cell))
             stack.append(next_cell)
+            if track and len(stack) > peak:
+                peak = len(stack)
         else:
             # Backtrack
             steps.append(("backtrack", current))
             stack.pop() 
 
-    t1 = time.time()
+    t1 = time.perf_counter()
     real_time = t1 - t0
 
+    if track:
+        # Each visited cell is pushed (and expanded) once; each backtrack is a pop
+        stats.nodes_expanded = len(visited)
+        stats.pushes = len(visited)
+        stats.pops = len(steps) - len(visited)
+        stats.peak_frontier = peak
+        stats.search_time = real_time
+
     # Reconstruct path
     if not found:
         return steps, None, real_time
 
-    path = []
-    cur = goal
-    while cur != start and cur in parent:
-        path.append(cur)
-        cur = parent[cur]
-    
-    if cur == start:
-        path.append(start)
-        path.reverse()
-        return steps, path, real_time
-    else:
-        return steps, None, real_time
\ No newline at end of file
+    path = reconstruct_path(parent, start, goal, stats)
+    return steps, path, real_time
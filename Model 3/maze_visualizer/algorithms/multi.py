@@ -0,0 +1,179 @@
+import time
+import heapq
+from collections import deque
+
+from algorithms.path_utils import reconstruct_path_from_sources
+
+# Above this many goals the exact min-over-goals heuristic costs more per
+# node than it saves, so A* switches to the goals' bounding box instead
+EXACT_HEURISTIC_MAX_GOALS = 16
+
+
+def _unique(cells, what):
+    cells = list(dict.fromkeys(cells))  # Drop duplicates, keep the caller's order
+    if not cells:
+        raise ValueError(f"At least one {what} cell is required")
+    return cells
+
+
+def goal_heuristic(goals):
+    """
+    Returns h(cell): a lower bound on the Manhattan distance to the nearest goal.
+    For a few goals this is the exact minimum over all of them; for many goals
+    it is the distance to their bounding box, which is still admissible and
+    costs the same no matter how many goals there are.
+    """
+    if len(goals) <= EXACT_HEURISTIC_MAX_GOALS:
+        def h(cell):
+            r, c = cell
+            return min(abs(r - gr) + abs(c - gc) for gr, gc in goals)
+        return h
+
+    min_r = min(r for r, _ in goals)
+    max_r = max(r for r, _ in goals)
+    min_c = min(c for _, c in goals)
+    max_c = max(c for _, c in goals)
+
+    def h(cell):
+        r, c = cell
+        dr = min_r - r if r < min_r else (r - max_r if r > max_r else 0)
+        dc = min_c - c if c < min_c else (c - max_c if c > max_c else 0)
+        return dr + dc
+    return h
+
+
+def multi_bfs_solve(maze, starts, goals, stats=None):
+    """
+    Multi-source BFS: every start is queued at distance 0 and the search stops
+    at the first goal popped, which is the closest (start, goal) pair overall.
+    One search regardless of how many starts and goals there are.
+    Returns (steps, pair, path, real_time)
+    pair: (start, goal) that won, or None if no goal is reachable
+    steps actions: ("visit", (r,c))
+    """
+    starts = _unique(starts, "start")
+    goals = set(_unique(goals, "goal"))
+    rows = len(maze)
+    cols = len(maze[0])
+
+    t0 = time.perf_counter()
+
+    visited = set(starts)
+    parent = {}
+    steps = []
+
+    q = deque(starts)
+
+    found = None
+    track = stats is not None
+    peak = len(q)
+
+    while q:
+        if track and len(q) > peak:
+            peak = len(q)
+        current = q.popleft()
+        steps.append(("visit", current))
+
+        if current in goals:
+            found = current
+            break
+
+        r, c = current
+        for nr, nc in [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]:
+            neighbor = (nr, nc)
+            if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 0 and neighbor not in visited:
+                visited.add(neighbor)
+                parent[neighbor] = current
+                q.append(neighbor)
+
+    t1 = time.perf_counter()
+    real_time = t1 - t0
+
+    if track:
+        stats.nodes_expanded = len(steps)
+        stats.pops = len(steps)
+        stats.pushes = len(visited)
+        stats.peak_frontier = peak
+        stats.search_time = real_time
+
+    if found is None:
+        return steps, None, None, real_time
+
+    path = reconstruct_path_from_sources(parent, found, stats)
+    return steps, (path[0], found), path, real_time
+
+
+def multi_astar_solve(maze, starts, goals, stats=None):
+    """
+    Multi-source, multi-goal A*. All starts enter the open set with g = 0 and
+    the heuristic is the distance to the nearest goal (see goal_heuristic),
+    so the first goal expanded ends the shortest path between any pair.
+    Returns (steps, pair, path, real_time)
+    pair: (start, goal) that won, or None if no goal is reachable
+    steps: ("visit", (r,c))
+    """
+    starts = _unique(starts, "start")
+    goal_list = _unique(goals, "goal")
+    goals = set(goal_list)
+    h = goal_heuristic(goal_list)
+    rows = len(maze)
+    cols = len(maze[0])
+
+    t0 = time.perf_counter()
+
+    # open_heap stores (f_score, g_score, coordinates), as in astar_solve
+    open_heap = [(h(s), 0, s) for s in starts]
+    heapq.heapify(open_heap)
+    parent = {}
+    gscore = {s: 0 for s in starts}
+    closed = set()
+    steps = []
+
+    found = None
+    track = stats is not None
+    peak = len(open_heap)
+    stale = 0
+
+    while open_heap:
+        if track and len(open_heap) > peak:
+            peak = len(open_heap)
+        f, g, current = heapq.heappop(open_heap)
+
+        if current in closed:
+            stale += 1
+            continue
+
+        closed.add(current)
+        steps.append(("visit", current))
+
+        if current in goals:
+            found = current
+            break
+
+        r, c = current
+        for nr, nc in [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]:
+            neighbor = (nr, nc)
+            if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 0:
+                tentative_g = g + 1
+
+                if tentative_g < gscore.get(neighbor, float('inf')):
+                    parent[neighbor] = current
+                    gscore[neighbor] = tentative_g
+                    heapq.heappush(open_heap, (tentative_g + h(neighbor), tentative_g, neighbor))
+
+    t1 = time.perf_counter()
+    real_time = t1 - t0
+
+    if track:
+        stats.nodes_expanded = len(closed)
+        stats.stale_skips = stale
+        stats.pops = len(closed) + stale
+        stats.pushes = stats.pops + len(open_heap)
+        stats.peak_frontier = peak
+        stats.search_time = real_time
+
+    if found is None:
+        return steps, None, None, real_time
+
+    path = reconstruct_path_from_sources(parent, found, stats)
+    return steps, (path[0], found), path, real_time
@@ -0,0 +1,244 @@
+import time
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+# Frontiers smaller than this are expanded in the main process; shipping them
+# to the workers would cost more than the expansion itself. The BFS frontier
+# of a maze grows roughly with its side length, so only very large grids
+# reach it; parallel_bfs_solve(min_parallel_frontier=...) can lower it.
+MIN_PARALLEL_FRONTIER = 4096
+
+
+# ---------------------------------------------------------
+# Shared state (one copy per process, attached by name)
+# ---------------------------------------------------------
+class SharedGrid:
+    """
+    The grid and the search arrays, placed in shared memory so every worker
+    sees them without copying. Cells are numbered r * cols + c.
+      grid:     1 byte per cell, 0 = open, 1 = wall
+      dist:     int32 BFS level per cell, -1 = not reached yet
+      parent:   int32 cell the BFS reached this cell from, -1 = none
+      frontier: int64 encoded entries of the current level (see _expand)
+    """
+
+    FIELDS = (("grid", "B", 1), ("dist", "i", 4), ("parent", "i", 4), ("frontier", "q", 8))
+
+    def __init__(self, rows, cols, names=None):
+        self.rows = rows
+        self.cols = cols
+        self.n = rows * cols
+        self.owner = names is None
+        self.blocks = []
+        for i, (field, fmt, size) in enumerate(self.FIELDS):
+            if self.owner:
+                shm = SharedMemory(create=True, size=max(1, self.n * size))
+            else:
+                shm = SharedMemory(name=names[i])
+            self.blocks.append(shm)
+            setattr(self, field, shm.buf[:self.n * size].cast(fmt))
+
+    def names(self):
+        return [shm.name for shm in self.blocks]
+
+    def close(self):
+        for field, _, _ in self.FIELDS:
+            getattr(self, field).release()
+        for shm in self.blocks:
+            shm.close()
+            if self.owner:
+                shm.unlink()
+
+
+_shared = None
+
+
+def _attach(rows, cols, names):
+    """Pool initializer: attach this worker to the parent's shared memory."""
+    global _shared
+    _shared = SharedGrid(rows, cols, names)
+
+
+# ---------------------------------------------------------
+# One BFS level = expand (read-only) + claim (owner writes)
+# ---------------------------------------------------------
+def _expand(task):
+    """
+    Phase 1: reads frontier[lo:hi] and proposes every unreached open neighbor.
+    A proposal is encoded as (pos * 4 + direction) * n + neighbor, so sorting
+    proposals reproduces the order a FIFO queue would have discovered them.
+    Proposals are bucketed by the row band that owns the neighbor.
+    """
+    lo, hi, band_rows, bands = task
+    s = _shared
+    grid, dist, frontier = s.grid, s.dist, s.frontier
+    n, rows, cols = s.n, s.rows, s.cols
+    out = [array('q') for _ in range(bands)]
+
+    for pos in range(lo, hi):
+        u = frontier[pos] % n
+        r, c = divmod(u, cols)
+        key = pos * 4 * n
+        # Same neighbor order as bfs_solve: Up, Down, Left, Right
+        if r > 0:
+            v = u - cols
+            if dist[v] < 0 and not grid[v]:
+                out[(r - 1) // band_rows].append(key + v)
+        if r < rows - 1:
+            v = u + cols
+            if dist[v] < 0 and not grid[v]:
+                out[(r + 1) // band_rows].append(key + n + v)
+        if c > 0:
+            v = u - 1
+            if dist[v] < 0 and not grid[v]:
+                out[r // band_rows].append(key + 2 * n + v)
+        if c < cols - 1:
+            v = u + 1
+            if dist[v] < 0 and not grid[v]:
+                out[r // band_rows].append(key + 3 * n + v)
+
+    return [b.tobytes() for b in out]
+
+
+def _claim(task):
+    """
+    Phase 2: the only writer for its row band. Walks the band's proposals in
+    discovery order and keeps the first one for every cell, so no atomics are
+    needed. Returns the accepted proposals, still in discovery order.
+    """
+    level, chunks = task
+    s = _shared
+    dist, parent, n, cols = s.dist, s.parent, s.n, s.cols
+    back = (cols, -cols, 1, -1)  # Step from the neighbor back to its parent, per direction
+    accepted = array('q')
+
+    proposals = array('q')
+    for chunk in chunks:
+        proposals.frombytes(chunk)
+
+    for enc in proposals:
+        v = enc % n
+        if dist[v] < 0:
+            dist[v] = level
+            parent[v] = v + back[(enc // n) & 3]
+            accepted.append(enc)
+
+    return accepted.tobytes()
+
+
+def _run_level(pool, s, length, level, workers, min_parallel_frontier):
+    """Expands one BFS level. Returns (next level length, whether the pool was used)."""
+    band_rows = -(-s.rows // workers)  # Ceiling division
+    on_pool = pool is not None and length >= min_parallel_frontier
+    if not on_pool:
+        parts = 1
+        run = lambda func, tasks: [func(t) for t in tasks]
+    else:
+        parts = workers
+        run = pool.map
+
+    step = -(-length // parts)
+    tasks = [(lo, min(lo + step, length), band_rows, workers) for lo in range(0, length, step)]
+    proposed = run(_expand, tasks)
+
+    # Band b gets its proposals from every expand task, in frontier order
+    claims = [(level, [p[b] for p in proposed]) for b in range(workers)]
+    accepted = run(_claim, claims)
+
+    # Each band is already sorted; merging them gives the next level in FIFO order
+    merged = array('q')
+    for blob in accepted:
+        merged.frombytes(blob)
+    merged = array('q', sorted(merged))
+    s.frontier[:len(merged)] = merged
+    return len(merged), on_pool
+
+
+# ---------------------------------------------------------
+# Public API
+# ---------------------------------------------------------
+def parallel_bfs_solve(maze, start, goal, workers=4, stats=None,
+                       min_parallel_frontier=MIN_PARALLEL_FRONTIER):
+    """
+    Level-synchronous BFS over shared memory for very large grids.
+    Each level is split across worker processes; new cells are claimed by the
+    worker that owns their row band. Parents are chosen exactly as a FIFO queue
+    would choose them, so the path is the same one bfs_solve returns.
+    Returns (steps, path, real_time)
+    steps is always empty: recording every visit would defeat the purpose
+    at these sizes.
+    stats: optional SolveStats (peak_frontier is the largest BFS level,
+    parallel_levels how many levels were big enough to go to the pool).
+    min_parallel_frontier: smallest level handed to the workers.
+    real_time and stats.search_time cover the search only, not starting the
+    worker pool or copying the maze into shared memory.
+    """
+    global _shared
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    rows = len(maze)
+    cols = len(maze[0])
+    s = SharedGrid(rows, cols)
+    pool = None
+    try:
+        unset = array('i', [-1]) * cols
+        for r, row in enumerate(maze):
+            s.grid[r * cols:(r + 1) * cols] = bytes(row)
+            s.dist[r * cols:(r + 1) * cols] = unset
+            s.parent[r * cols:(r + 1) * cols] = unset
+
+        if workers > 1:
+            pool = Pool(workers, initializer=_attach, initargs=(rows, cols, s.names()))
+        _shared = s  # Small levels run in this process
+
+        t0 = time.perf_counter()
+
+        g = goal[0] * cols + goal[1]
+        first = start[0] * cols + start[1]
+        s.dist[first] = 0
+        s.frontier[0] = first
+        length, level = 1, 0
+        expanded, reached, peak = 0, 1, 1
+        on_pool_levels = 0
+
+        while length and s.dist[g] < 0:
+            level += 1
+            expanded += length
+            length, on_pool = _run_level(pool, s, length, level, workers, min_parallel_frontier)
+            on_pool_levels += on_pool
+            reached += length
+            peak = max(peak, length)
+
+        t1 = time.perf_counter()
+        real_time = t1 - t0
+
+        if stats is not None:
+            stats.nodes_expanded = expanded
+            stats.pops = expanded
+            stats.pushes = reached
+            stats.peak_frontier = peak
+            stats.parallel_levels = on_pool_levels
+            stats.search_time = real_time
+
+        if s.dist[g] < 0:
+            return [], None, real_time
+
+        t2 = time.perf_counter()
+        path = []
+        cur = g
+        while cur != first:
+            path.append(divmod(cur, cols))
+            cur = s.parent[cur]
+        path.append(start)
+        path.reverse()
+        if stats is not None:
+            stats.reconstruct_time = time.perf_counter() - t2
+
+        return [], path, real_time
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        _shared = None
+        s.close()
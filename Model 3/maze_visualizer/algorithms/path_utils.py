@@ -0,0 +1,45 @@
+import time
+
+def reconstruct_path(parent, start, goal, stats=None):
+    """
+    Walks the parent links back from goal to start.
+    Returns the path as a list from start to goal, or None if the links
+    do not lead back to start. The time taken is stored in stats if given.
+    """
+    t0 = time.perf_counter()
+
+    path = []
+    cur = goal
+    # Safety check for path reconstruction
+    while cur != start and cur in parent:
+        path.append(cur)
+        cur = parent[cur]
+
+    if cur == start:
+        path.append(start)
+        path.reverse()
+    else:
+        path = None
+
+    if stats is not None:
+        stats.reconstruct_time = time.perf_counter() - t0
+    return path
+
+def reconstruct_path_from_sources(parent, goal, stats=None):
+    """
+    Like reconstruct_path, but for multi-source searches: walks back from goal
+    until a cell without a parent (the source that won) is reached.
+    Returns the path from that source to goal.
+    """
+    t0 = time.perf_counter()
+
+    path = [goal]
+    cur = goal
+    while cur in parent:
+        cur = parent[cur]
+        path.append(cur)
+    path.reverse()
+
+    if stats is not None:
+        stats.reconstruct_time = time.perf_counter() - t0
+    return path
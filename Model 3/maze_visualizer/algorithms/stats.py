@@ -0,0 +1,51 @@
+import time
+
+
+class SolveStats:
+    """
+    Optional counters filled in by the solvers (pass stats=SolveStats()).
+    Most counters are derived from the solver's own data structures after the
+    search, so leaving stats as None costs (almost) nothing.
+    """
+
+    def __init__(self):
+        self.nodes_expanded = 0     # Cells taken off the frontier and processed
+        self.pushes = 0             # Frontier insertions (queue / stack / heap)
+        self.pops = 0               # Frontier removals
+        self.stale_skips = 0        # A*: popped entries already closed via a better path
+        self.peak_frontier = 0      # Largest frontier size seen
+        self.parallel_levels = 0    # parallel_bfs_solve: BFS levels that ran on the worker pool
+        self.search_time = 0.0      # Seconds spent in the main search loop (see estimate_trace_time)
+        self.trace_time = 0.0       # Estimated part of that spent recording steps; 0 until estimated
+        self.reconstruct_time = 0.0 # Seconds spent walking parents back to the start
+
+    def as_dict(self):
+        return dict(vars(self))
+
+    def summary(self):
+        return (f"Expanded: {self.nodes_expanded} | Push/Pop: {self.pushes}/{self.pops} | "
+                f"Stale: {self.stale_skips} | Peak frontier: {self.peak_frontier} | "
+                f"Search: {self.search_time * 1000:.3f} ms | Trace: {self.trace_time * 1000:.3f} ms | "
+                f"Path: {self.reconstruct_time * 1000:.3f} ms")
+
+    def estimate_trace_time(self, steps):
+        """
+        Moves the estimated cost of recording steps out of search_time into
+        trace_time. The solvers' search_time includes the steps.append calls
+        (timing each one would cost more than the append itself), so call this
+        after the solve, outside anything being timed: it rebuilds the same list
+        of (action, cell) tuples and subtracts the bare loop overhead.
+        """
+        loop_time = self.search_time + self.trace_time  # Safe to call twice
+        replay = []
+        append = replay.append
+        t0 = time.perf_counter()
+        for action, cell in steps:
+            append((action, cell))
+        t1 = time.perf_counter()
+        for action, cell in steps:
+            pass
+        t2 = time.perf_counter()
+
+        self.trace_time = min(loop_time, max(0.0, (t1 - t0) - (t2 - t1)))
+        self.search_time = loop_time - self.trace_time
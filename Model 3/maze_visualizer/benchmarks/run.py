@@ -0,0 +1,170 @@
+"""
+Headless benchmark runner for the maze generators and solvers.
+
+Run from the maze_visualizer folder:
+    python -m benchmarks.run run --sizes 31 61 121 --output results.json
+    python -m benchmarks.run run --baseline baseline.json
+    python -m benchmarks.run compare baseline.json results.json
+    python -m benchmarks.run profile astar --size 201 --mode sampling
+    python -m benchmarks.run scaling --size 2001 --workers 1 2 4 8
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from generator.maze_cache import MazeCache
+from benchmarks.suite import run_suite, run_scaling, compare
+from algorithms.parallel_bfs import MIN_PARALLEL_FRONTIER
+from profiling.profiler import MODES, SOLVERS, profile_generation, profile_solve
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def report_regressions(baseline, current, threshold):
+    regressions = compare(baseline, current, threshold)
+    if not regressions:
+        print(f"No regressions above {threshold:.0%}.")
+        return 0
+
+    print(f"{len(regressions)} regression(s) above {threshold:.0%}:")
+    for (name, rows, cols, density), old, new, change in regressions:
+        print(f"  {name:<14} {rows}x{cols} density={density}: "
+              f"{old * 1000:.3f}ms -> {new * 1000:.3f}ms (+{change:.0%})")
+    return 1
+
+
+def write_results(args, results):
+    meta = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "warmup": args.warmup,
+        "repeats": args.repeats,
+    }
+    with open(args.output, "w") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+def cmd_run(args):
+    cache = None if args.no_cache else MazeCache(args.cache_dir)
+    results = run_suite(
+        args.sizes, args.densities,
+        seed=args.seed, warmup=args.warmup, repeats=args.repeats,
+        only=args.only, cache=cache,
+    )
+
+    if args.output:
+        write_results(args, results)
+
+    if args.baseline:
+        return report_regressions(load_results(args.baseline), results, args.threshold)
+    return 0
+
+
+def cmd_scaling(args):
+    cache = None if args.no_cache else MazeCache(args.cache_dir)
+    results = run_scaling(
+        args.size, args.density, args.workers,
+        seed=args.seed, warmup=args.warmup, repeats=args.repeats, cache=cache,
+        min_parallel_frontier=args.min_frontier,
+    )
+
+    if args.output:
+        write_results(args, results)
+
+    if args.baseline:
+        return report_regressions(load_results(args.baseline), results, args.threshold)
+    return 0
+
+
+def cmd_compare(args):
+    return report_regressions(load_results(args.baseline), load_results(args.current), args.threshold)
+
+
+def cmd_profile(args):
+    prefix = args.output or f"profiles/{args.target}_{args.size}x{args.size}_{args.mode}"
+    if args.target == "generate":
+        _, prof = profile_generation(args.size, args.size, args.density, seed=args.seed,
+                                     mode=args.mode, interval=args.interval)
+    else:
+        maze, _ = profile_generation(args.size, args.size, args.density, seed=args.seed,
+                                     mode=args.mode, interval=args.interval)
+        goal = (len(maze) - 1, len(maze[0]) - 1)
+        _, stats, prof = profile_solve(maze, args.target, (0, 0), goal,
+                                       mode=args.mode, interval=args.interval)
+        print(stats.summary())
+
+    for path in prof.write(prefix):
+        print(f"Wrote {path}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark maze generators and solvers.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run the benchmark sweep")
+    run.add_argument("--sizes", type=int, nargs="+", default=[31, 61, 121])
+    run.add_argument("--densities", type=float, nargs="+", default=[0.0, 0.05, 0.2])
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--only", nargs="+", help="Keep only cases whose name starts with one of these (e.g. generate model3.)")
+    run.add_argument("--output", help="Write results to this JSON file")
+    run.add_argument("--baseline", help="Compare against this saved JSON file after running")
+    run.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown before flagging (0.10 = 10%%)")
+    run.add_argument("--cache-dir", help="Maze cache folder (default: MAZE_CACHE_DIR or ~/.cache/maze_visualizer)")
+    run.add_argument("--no-cache", action="store_true", help="Always regenerate the mazes")
+    run.set_defaults(func=cmd_run)
+
+    scaling = sub.add_parser("scaling", help="Time the shared-memory parallel BFS across worker counts")
+    scaling.add_argument("--size", type=int, default=2001)
+    scaling.add_argument("--density", type=float, default=0.2)
+    scaling.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    # A 2001x2001 maze's BFS levels peak around 1400 cells, well under the
+    # solver's default MIN_PARALLEL_FRONTIER, so the benchmark uses a lower one
+    scaling.add_argument("--min-frontier", type=int, default=256,
+                         help=f"Smallest BFS level sent to the workers (solver default: {MIN_PARALLEL_FRONTIER})")
+    scaling.add_argument("--seed", type=int, default=0)
+    scaling.add_argument("--warmup", type=int, default=1)
+    scaling.add_argument("--repeats", type=int, default=3)
+    scaling.add_argument("--output", help="Write results to this JSON file")
+    scaling.add_argument("--baseline", help="Compare against this saved JSON file after running")
+    scaling.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown before flagging (0.10 = 10%%)")
+    scaling.add_argument("--cache-dir", help="Maze cache folder (default: MAZE_CACHE_DIR or ~/.cache/maze_visualizer)")
+    scaling.add_argument("--no-cache", action="store_true", help="Always regenerate the maze")
+    scaling.set_defaults(func=cmd_scaling)
+
+    cmp_parser = sub.add_parser("compare", help="Compare two saved result files")
+    cmp_parser.add_argument("baseline")
+    cmp_parser.add_argument("current")
+    cmp_parser.add_argument("--threshold", type=float, default=0.10)
+    cmp_parser.set_defaults(func=cmd_compare)
+
+    prof = sub.add_parser("profile", help="Profile one generation or solve and export traces")
+    prof.add_argument("target", choices=["generate", *SOLVERS])
+    prof.add_argument("--size", type=int, default=201)
+    prof.add_argument("--density", type=float, default=0.05)
+    prof.add_argument("--seed", type=int, default=0)
+    prof.add_argument("--mode", choices=MODES, default="cprofile")
+    prof.add_argument("--interval", type=float, default=0.001, help="Sampling interval in seconds")
+    prof.add_argument("--output", help="Output path prefix (default: profiles/<target>_<size>_<mode>)")
+    prof.set_defaults(func=cmd_profile)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "repeats", 1) < 1:
+        parser.error("--repeats must be at least 1")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
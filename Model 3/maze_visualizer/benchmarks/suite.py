@@ -0,0 +1,296 @@
+import importlib.util
+import math
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from generator.maze_generator import generate_maze
+from algorithms.dfs import dfs_solve
+from algorithms.bfs import bfs_solve
+from algorithms.astar import astar_solve
+from algorithms.parallel_bfs import parallel_bfs_solve, MIN_PARALLEL_FRONTIER
+from algorithms.stats import SolveStats
+
+# Repository root (benchmarks -> maze_visualizer -> Model 3 -> root)
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+
+# ---------------------------------------------------------
+# Loading the Model 1 / Model 2 solvers
+# ---------------------------------------------------------
+def load_module(name, folder, filename):
+    """Imports a script from one of the 'Model N' folders by file path."""
+    folder = os.path.join(REPO_ROOT, folder)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)  # Model 2/maze_solver.py imports its sibling generator
+    spec = importlib.util.spec_from_file_location(name, os.path.join(folder, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def script_solver(module, method):
+    """
+    Wraps a Model 1/2 MazeSolver method in the prepare(maze) shape used by the
+    suite. The MazeSolver is built in prepare, outside the timed region.
+    Those solvers only count expanded nodes (left on the engine by the last
+    timed run), so stats is a dict with just that; the other SolveStats fields
+    stay None in the results.
+    """
+    def prepare(maze):
+        engine = module.MazeSolver(maze)
+        search = getattr(engine, method)
+        return search, lambda start, goal: {"nodes_expanded": engine.expanded}
+    return prepare
+
+
+def model3_solver(func):
+    """
+    The timed solve runs with stats=None. Stats come from one extra untimed
+    run, so their bookkeeping never shows up in the median or peak memory.
+    """
+    def prepare(maze):
+        def solve(start, goal):
+            return func(maze, start, goal)[1]
+
+        def collect_stats(start, goal):
+            stats = SolveStats()
+            steps, _, _ = func(maze, start, goal, stats)
+            stats.estimate_trace_time(steps)
+            return stats
+        return solve, collect_stats
+    return prepare
+
+
+def load_models():
+    return {
+        "model1": load_module("model1_path", "Model 1", "path.py"),
+        "model2": load_module("model2_maze_solver", "Model 2", "maze_solver.py"),
+    }
+
+
+def get_builders():
+    """Returns {name: build(maze)} for the one-off per-maze setup steps worth timing."""
+    return {f"{prefix}.build": module.MazeSolver for prefix, module in load_models().items()}
+
+
+def get_solvers():
+    """
+    Returns {name: prepare(maze) -> (solve, collect_stats)}.
+    solve(start, goal) -> path is what gets timed; collect_stats(start, goal)
+    is called once afterwards and returns a SolveStats or a dict of the
+    stats that solver has.
+    """
+    solvers = {
+        "model3.dfs": model3_solver(dfs_solve),
+        "model3.bfs": model3_solver(bfs_solve),
+        "model3.astar": model3_solver(astar_solve),
+    }
+    for prefix, module in load_models().items():
+        solvers[f"{prefix}.dfs"] = script_solver(module, "dfs")
+        solvers[f"{prefix}.bfs"] = script_solver(module, "bfs")
+        solvers[f"{prefix}.astar"] = script_solver(module, "astar")
+    return solvers
+
+
+# ---------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(func, warmup=1, repeats=5, trace_memory=True):
+    """
+    Times func() with perf_counter after some warmup calls, then runs it once
+    more under tracemalloc (kept separate because tracing slows everything down).
+    Returns (timings, peak_bytes, last_result); peak_bytes is None when
+    trace_memory is off.
+    """
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - t0)
+
+    if not trace_memory:
+        return timings, None, result
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return timings, peak, result
+
+
+def summarize(name, rows, cols, density, timings, peak, stats=None, path_length=None):
+    result = {
+        "name": name,
+        "rows": rows,
+        "cols": cols,
+        "density": density,
+        "repeats": len(timings),
+        "median_s": statistics.median(timings),
+        "p95_s": percentile(timings, 95),
+        "peak_bytes": peak,
+        "path_length": path_length,
+    }
+    # Every result has every stats field; None means the solver does not measure it
+    result.update(dict.fromkeys(SolveStats().as_dict()))
+    if isinstance(stats, dict):
+        result.update(stats)
+    elif stats is not None:
+        result.update(stats.as_dict())
+    return result
+
+
+def run_suite(sizes, densities, seed=0, warmup=1, repeats=5, only=None, cache=None, log=print):
+    """
+    Sweeps every (size, density) pair: times generate_maze, the per-maze solver
+    setup, then every solver on the same seeded maze. only is an optional list
+    of name prefixes to keep.
+    """
+    def wanted(name):
+        return not only or any(name.startswith(prefix) for prefix in only)
+
+    builders = {name: f for name, f in get_builders().items() if wanted(name)}
+    solvers = {name: f for name, f in get_solvers().items() if wanted(name)}
+    results = []
+
+    for size in sizes:
+        for density in densities:
+            if wanted("generate"):
+                timings, peak, _ = measure(lambda: generate_maze(size, size, density, seed=seed), warmup, repeats)
+                results.append(summarize("generate", size, size, density, timings, peak))
+                log(format_result(results[-1]))
+
+            if cache is not None:
+                maze = cache.get_or_generate(size, size, density, seed=seed)
+            else:
+                maze = generate_maze(size, size, density, seed=seed)
+            rows, cols = len(maze), len(maze[0])
+            start, goal = (0, 0), (rows - 1, cols - 1)
+
+            for name, build in builders.items():
+                timings, peak, _ = measure(lambda: build(maze), warmup, repeats)
+                results.append(summarize(name, rows, cols, density, timings, peak))
+                log(format_result(results[-1]))
+
+            for name, prepare in solvers.items():
+                solve, collect_stats = prepare(maze)
+                timings, peak, path = measure(lambda: solve(start, goal), warmup, repeats)
+                stats = collect_stats(start, goal)
+                results.append(summarize(
+                    name, rows, cols, density, timings, peak,
+                    stats=stats,
+                    path_length=len(path) if path else None,
+                ))
+                log(format_result(results[-1]))
+
+    return results
+
+
+def run_scaling(size, density, workers_list, seed=0, warmup=1, repeats=3, cache=None, log=print,
+                min_parallel_frontier=MIN_PARALLEL_FRONTIER):
+    """
+    Times parallel_bfs_solve on one large maze for each worker count, next to
+    the serial bfs_solve, and checks that every run returns bfs_solve's path.
+    Each call starts its own worker pool and copies the maze into shared
+    memory, so the wall time (median_s) mostly measures that setup on small
+    mazes. Speedup is therefore computed from the solver's own search time
+    (search_median_s), which leaves the setup out.
+    Only levels of at least min_parallel_frontier cells go to the workers; the
+    run warns when none did, since the worker counts then all measure the
+    same serial search.
+    Memory is not traced: tracemalloc cannot see the worker processes.
+    """
+    if cache is not None:
+        maze = cache.get_or_generate(size, size, density, seed=seed)
+    else:
+        maze = generate_maze(size, size, density, seed=seed)
+    rows, cols = len(maze), len(maze[0])
+    start, goal = (0, 0), (rows - 1, cols - 1)
+    results = []
+
+    timings, _, (_, expected, _) = measure(lambda: bfs_solve(maze, start, goal), warmup, repeats, trace_memory=False)
+    results.append(summarize("model3.bfs", rows, cols, density, timings, None,
+                             path_length=len(expected) if expected else None))
+    log(format_result(results[-1]))
+
+    base = None
+    for workers in workers_list:
+        search_times = []
+
+        def solve():
+            stats = SolveStats()
+            result = parallel_bfs_solve(maze, start, goal, workers=workers, stats=stats,
+                                        min_parallel_frontier=min_parallel_frontier)
+            search_times.append(stats.search_time)
+            return stats, result[1]
+
+        timings, _, (stats, path) = measure(solve, warmup, repeats, trace_memory=False)
+        if path != expected:
+            raise AssertionError(f"parallel_bfs_solve with {workers} workers returned a different path")
+        search_times = search_times[warmup:]  # Same runs as timings
+        result = summarize(f"model3.parallel_bfs.w{workers}", rows, cols, density, timings, None,
+                           stats=stats, path_length=len(path) if path else None)
+        result["workers"] = workers
+        result["min_parallel_frontier"] = min_parallel_frontier
+        result["search_median_s"] = statistics.median(search_times)
+        base = base or result["search_median_s"]
+        result["speedup"] = base / result["search_median_s"]  # Relative to the first worker count
+        results.append(result)
+        log(format_result(results[-1]) +
+            f" search={result['search_median_s'] * 1000:.3f}ms speedup={result['speedup']:.2f}x"
+            f" pool_levels={stats.parallel_levels}")
+        if workers > 1 and stats.parallel_levels == 0:
+            log(f"WARNING: no BFS level reached {min_parallel_frontier} cells (largest was "
+                f"{stats.peak_frontier}), so the {workers} workers were never used. "
+                f"Lower --min-frontier or use a bigger maze.")
+
+    return results
+
+
+def format_result(result):
+    nodes = result["nodes_expanded"]
+    peak = result["peak_bytes"]
+    peak = f"{peak / 1024:9.1f}KiB" if peak is not None else f"{'-':>12}"
+    return (f"{result['name']:<14} {result['rows']:>5}x{result['cols']:<5} density={result['density']:<5} "
+            f"median={result['median_s'] * 1000:9.3f}ms p95={result['p95_s'] * 1000:9.3f}ms "
+            f"peak={peak} nodes={nodes if nodes is not None else '-'}")
+
+
+# ---------------------------------------------------------
+# Regression check
+# ---------------------------------------------------------
+def result_key(result):
+    return (result["name"], result["rows"], result["cols"], result["density"])
+
+
+def compare(baseline, current, threshold=0.10):
+    """
+    Matches results by (name, rows, cols, density) and returns a list of
+    (key, baseline_median, current_median, change) for every case whose median
+    time grew by more than threshold (0.10 = 10% slower).
+    """
+    base = {result_key(r): r for r in baseline}
+    regressions = []
+    for result in current:
+        old = base.get(result_key(result))
+        if old is None or old["median_s"] == 0:
+            continue
+        change = result["median_s"] / old["median_s"] - 1
+        if change > threshold:
+            regressions.append((result_key(result), old["median_s"], result["median_s"], change))
+    return regressions
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import tempfile
+
+from generator.maze_generator import generate_maze
+
+# Default location; override with the MAZE_CACHE_DIR environment variable
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "maze_visualizer")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class MazeCache:
+    """
+    On-disk cache of seeded mazes.
+    Each maze is stored in a file named after the hash of
+    (generator, rows, cols, density, seed), so the same request always maps to
+    the same file. When the cache grows past max_bytes the least recently used
+    files are deleted first (file modification time is refreshed on every hit).
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or os.environ.get("MAZE_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_or_generate(self, rows, cols, density=0.05, seed=0, generator=generate_maze, name=None):
+        """
+        Returns the maze for these settings, generating and storing it on a miss.
+        name identifies the generator in the key; it defaults to the function's
+        module and name. Unseeded requests (seed=None) are never cached because
+        they cannot be reproduced.
+        """
+        if seed is None:
+            return generator(rows, cols, density, seed=None)
+
+        if name is None:
+            name = f"{generator.__module__}.{generator.__qualname__}"
+        path = self._path(name, rows, cols, density, seed)
+
+        maze = self._load(path)
+        if maze is not None:
+            return maze
+
+        maze = generator(rows, cols, density, seed=seed)
+        self._store(path, maze)
+        self._evict()
+        return maze
+
+    def clear(self):
+        for entry in self._entries():
+            self._remove(entry.path)
+
+    def size_bytes(self):
+        return sum(size for _, size, _ in self._stats())
+
+    # --- Helpers ---
+    def _path(self, name, rows, cols, density, seed):
+        key = f"{name}|{rows}|{cols}|{density!r}|{seed!r}"
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, digest + ".maze")
+
+    def _entries(self):
+        return [e for e in os.scandir(self.directory) if e.is_file() and e.name.endswith(".maze")]
+
+    def _load(self, path):
+        try:
+            with open(path, "r") as f:
+                maze = [[1 if ch == "1" else 0 for ch in line.rstrip("\n")] for line in f]
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            pass  # Evicted by another process after we read it; the maze is still good
+        return maze
+
+    def _store(self, path, maze):
+        # Write to a temp file first so a crash never leaves a half-written maze
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                for row in maze:
+                    f.write("".join("1" if cell else "0" for cell in row))
+                    f.write("\n")
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+    def _stats(self):
+        """(mtime, size, path) for every cache file, skipping files removed while we scan."""
+        stats = []
+        for entry in self._entries():
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            stats.append((st.st_mtime, st.st_size, entry.path))
+        return stats
+
+    def _remove(self, path):
+        # Several processes can share the cache directory, so another one may
+        # have deleted the file already
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        entries = self._stats()
+        total = sum(size for _, size, _ in entries)
+        # Oldest (least recently used) first
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
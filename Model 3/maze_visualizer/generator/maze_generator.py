@@ -1,12 +1,17 @@
 import random
 
-def generate_maze(rows, cols, density=0.05):
+def generate_maze(rows, cols, density=0.05, seed=None, phases=None):
     """
     Generates a random maze using Recursive Backtracking.
     rows, cols: Dimensions of the maze (should be odd numbers for best results).
     density: Chance (0.0 to 1.0) to remove random walls after generation to create loops.
+    seed: Optional seed; the same seed always gives the same maze.
+    phases: Optional Profiler; the carving and loop injection phases are marked on it.
     Returns a 2D list: 0=open, 1=wall
     """
+    # Private generator so seeding never touches the global random module
+    rng = random.Random(seed)
+
     # Ensure dimensions are odd
     if rows % 2 == 0:
         rows += 1
@@ -24,9 +29,12 @@ def generate_maze(rows, cols, density=0.05):
             nr, nc = r + dr, c + dc
             if 0 <= nr < rows and 0 <= nc < cols:
                 neighbors.append((nr, nc))
-        random.shuffle(neighbors)
+        rng.shuffle(neighbors)
         return neighbors
 
+    if phases is not None:
+        phases.begin("carving")
+
     # Start carving from (1, 1) to ensure outer walls are intact
     start_r, start_c = 1, 1
     maze[start_r][start_c] = 0
@@ -54,12 +62,19 @@ def generate_maze(rows, cols, density=0.05):
         if not found_unvisited:
             stack.pop()
 
+    if phases is not None:
+        phases.end("carving")
+        phases.begin("loop injection")
+
     # Add random loops (optional step)
     for r in range(1, rows - 1):
         for c in range(1, cols - 1):
-            if maze[r][c] == 1 and random.random() < density:
+            if maze[r][c] == 1 and rng.random() < density:
                 maze[r][c] = 0
 
+    if phases is not None:
+        phases.end("loop injection")
+
     # Ensure start (0, 0) and goal (rows-1, cols-1) are open paths, by opening 
     # the path leading to them from the carved interior.
     # Start: (1, 0) or (0, 1) must be 0, we choose (0, 1) and (rows-1, cols-2)
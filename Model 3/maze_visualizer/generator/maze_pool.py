@@ -0,0 +1,60 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from generator.maze_generator import generate_maze
+
+
+class MazePool:
+    """
+    Keeps a few pre-generated mazes ready so the UI never waits on generate_maze.
+    Mazes are built by worker processes for one (rows, cols, density) setting;
+    asking for a different setting throws the old mazes away and starts over.
+    """
+
+    def __init__(self, rows, cols, density=0.05, size=3, workers=None):
+        self.size = size
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.key = None
+        self.pending = deque()  # Futures in submission order (oldest first)
+        self.reset(rows, cols, density)
+
+    def reset(self, rows, cols, density=0.05):
+        """Discards every queued maze and refills the pool for the new settings."""
+        for future in self.pending:
+            future.cancel()  # Already running jobs finish, but their result is ignored
+        self.pending.clear()
+        self.key = (rows, cols, density)
+        self._refill()
+
+    def get(self, rows, cols, density=0.05):
+        """
+        Returns a maze for the given settings.
+        A finished maze is returned straight away; otherwise we wait for the
+        oldest job, which has had the longest head start.
+        """
+        if (rows, cols, density) != self.key:
+            self.reset(rows, cols, density)
+
+        ready = next((f for f in self.pending if f.done()), None)
+        if ready is None:
+            ready = self.pending[0]
+        self.pending.remove(ready)
+
+        maze = ready.result()
+        self._refill()
+        return maze
+
+    def ready_count(self):
+        """Number of mazes that can be handed out without waiting."""
+        return sum(1 for f in self.pending if f.done())
+
+    def shutdown(self):
+        for future in self.pending:
+            future.cancel()
+        self.pending.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _refill(self):
+        rows, cols, density = self.key
+        while len(self.pending) < self.size:
+            self.pending.append(self.executor.submit(generate_maze, rows, cols, density))
@@ -0,0 +1,81 @@
+"""
+Convert mazes between formats and render solved paths.
+
+Run from the maze_visualizer folder:
+    python -m maze_io.cli maze.png maze.txt
+    python -m maze_io.cli maze.pbm solved.png --solve bfs --scale 4
+    python -m maze_io.cli --generate 2001 2001 --seed 1 big.pbm
+"""
+import argparse
+import os
+import sys
+import time
+
+from generator.maze_generator import generate_maze
+from algorithms.bfs import bfs_solve
+from algorithms.astar import astar_solve
+from algorithms.parallel_bfs import parallel_bfs_solve
+from maze_io.formats import READERS, PATH_FORMATS, load_maze, save_maze
+
+
+def solve(maze, algo, start, goal, workers):
+    if algo == "parallel-bfs":
+        # Array-based, so it stays compact on very large grids
+        return parallel_bfs_solve(maze, start, goal, workers=workers)[1]
+    if algo == "astar":
+        return astar_solve(maze, start, goal)[1]
+    return bfs_solve(maze, start, goal)[1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert mazes between ASCII, PBM and PNG, optionally drawing a solved path.")
+    parser.add_argument("input", nargs="?", help="Maze file (.txt/.maze, .pbm, .png)")
+    parser.add_argument("output", help="Output file; the format follows the extension")
+    parser.add_argument("--generate", type=int, nargs=2, metavar=("ROWS", "COLS"), help="Generate a maze instead of reading input")
+    parser.add_argument("--density", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--solve", choices=["bfs", "astar", "parallel-bfs"], help="Draw the path found by this solver")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for parallel-bfs")
+    parser.add_argument("--start", type=int, nargs=2, metavar=("R", "C"), help="Default: top-left corner")
+    parser.add_argument("--goal", type=int, nargs=2, metavar=("R", "C"), help="Default: bottom-right corner")
+    parser.add_argument("--scale", type=int, default=1, help="PNG pixels per cell")
+    args = parser.parse_args(argv)
+
+    if (args.input is None) == (args.generate is None):
+        parser.error("give either an input file or --generate ROWS COLS")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    # Check the output format now, before a long load and solve
+    ext = os.path.splitext(args.output)[1].lower()
+    if ext not in READERS:
+        parser.error(f"unknown output format {ext!r}, expected one of {sorted(READERS)}")
+    if args.solve and ext not in PATH_FORMATS:
+        parser.error(f"{ext} cannot show a path; use one of {', '.join(PATH_FORMATS)} with --solve")
+
+    t0 = time.perf_counter()
+    if args.generate:
+        maze = generate_maze(*args.generate, args.density, seed=args.seed)
+    else:
+        maze = load_maze(args.input)
+    rows, cols = len(maze), len(maze[0])
+    print(f"Loaded {rows}x{cols} maze in {time.perf_counter() - t0:.3f}s")
+
+    path = None
+    start = tuple(args.start) if args.start else (0, 0)
+    goal = tuple(args.goal) if args.goal else (rows - 1, cols - 1)
+    if args.solve:
+        t0 = time.perf_counter()
+        path = solve(maze, args.solve, start, goal, args.workers)
+        if path is None:
+            print("No path found!")
+        else:
+            print(f"Path Length: {len(path)} steps ({time.perf_counter() - t0:.3f}s)")
+
+    t0 = time.perf_counter()
+    save_maze(args.output, maze, path, start, goal, scale=args.scale)
+    print(f"Wrote {args.output} in {time.perf_counter() - t0:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
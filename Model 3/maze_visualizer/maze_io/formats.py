@@ -0,0 +1,397 @@
+"""
+Streaming maze import/export.
+
+Mazes are read straight into the compact grid representation: a list of
+bytearray rows, one byte per cell (0 = open, 1 = wall). It indexes like the
+nested lists generate_maze returns, so every solver accepts it as-is, but
+takes 1 byte per cell instead of an 8-byte list slot.
+
+Files are read and written one row at a time. Path overlays are applied
+per row from a small {row: [(col, mark), ...]} index built from the path,
+so the grid itself is never copied.
+
+Formats (chosen by file extension in load_maze / save_maze):
+    .txt, .maze   ASCII: '#' is a wall, anything else is open
+    .pbm          Netpbm bitmap (P1 text or P4 binary): black is a wall
+    .png          PNG: dark pixels are walls. We write a 2-bit palette image
+                  (open, wall, path, start/goal)
+"""
+import os
+import struct
+import zlib
+
+# ---------------------------------------------------------
+# Shared helpers
+# ---------------------------------------------------------
+# '#' -> 1, everything else -> 0, applied with bytes.translate (C speed)
+_ASCII_TO_CELL = bytes(1 if i == ord('#') else 0 for i in range(256))
+_CELL_TO_ASCII = bytes.maketrans(b'\x00\x01', b' #')
+
+# Bit unpacking tables for 1-bit rows: byte -> 8 cells, most significant bit first
+_BITS_SET_IS_WALL = [bytes((b >> (7 - i)) & 1 for i in range(8)) for b in range(256)]
+_PACK_WALL_BITS = {cells: b for b, cells in enumerate(_BITS_SET_IS_WALL)}
+
+# P1 digits <-> cells
+_P1_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+_CELL_TO_P1_DIGIT = bytes.maketrans(b'\x00\x01', b'01')
+
+# Pixels darker than this (0-255 luminance) are walls
+WALL_LUMINANCE = 96
+
+IDAT_CHUNK = 1 << 20  # Flush compressed PNG data in chunks of about this size
+
+
+def _overlay_index(path, start=None, goal=None):
+    """Groups the path by row: {row: [(col, mark), ...]}; marks are '.', 'S', 'E'."""
+    if not path:
+        return {}
+    start = start or path[0]
+    goal = goal or path[-1]
+    rows = {}
+    for r, c in path:
+        rows.setdefault(r, []).append((c, '.'))
+    rows.setdefault(start[0], []).append((start[1], 'S'))
+    rows.setdefault(goal[0], []).append((goal[1], 'E'))
+    return rows
+
+
+def _check_width(row, cols, r):
+    if len(row) != cols:
+        raise ValueError(f"Row {r} has {len(row)} cells, expected {cols}")
+
+
+# ---------------------------------------------------------
+# ASCII
+# ---------------------------------------------------------
+def iter_ascii_rows(f):
+    """
+    Yields bytearray rows from a binary file of '#'/space lines.
+    Rows can be shorter than the maze is wide (an editor stripped their
+    trailing spaces); an empty line is an all-open row stripped to nothing.
+    Only an empty last line is skipped.
+    """
+    blank = False  # Held back until we know it is not the last line
+    for line in f:
+        line = line.rstrip(b'\r\n')
+        if blank:
+            yield bytearray()
+        blank = not line
+        if line:
+            yield bytearray(line.translate(_ASCII_TO_CELL))
+
+
+def read_ascii(filename):
+    with open(filename, 'rb') as f:
+        maze = list(iter_ascii_rows(f))
+    cols = max((len(row) for row in maze), default=0)
+    if not cols:
+        raise ValueError(f"{filename} contains no maze rows")
+    # The longest row gives the width; pad the others with open cells
+    for row in maze:
+        if len(row) < cols:
+            row.extend(bytes(cols - len(row)))
+    return maze
+
+
+def write_ascii(filename, maze, path=None, start=None, goal=None):
+    """Writes '#'/space rows; path cells become '.', its ends 'S' and 'E'."""
+    overlay = _overlay_index(path, start, goal)
+    with open(filename, 'wb') as f:
+        for r, row in enumerate(maze):
+            line = bytes(row).translate(_CELL_TO_ASCII)
+            marks = overlay.get(r)
+            if marks:
+                line = bytearray(line)
+                for c, mark in marks:
+                    line[c] = ord(mark)
+            f.write(line)
+            f.write(b'\n')
+
+
+# ---------------------------------------------------------
+# PBM (Netpbm bitmap)
+# ---------------------------------------------------------
+def _read_pbm_header(f):
+    """Returns (magic, cols, rows), leaving f at the start of the pixel data."""
+    tokens = []
+    while len(tokens) < 3:
+        line = f.readline()
+        if not line:
+            raise ValueError("Truncated PBM header")
+        tokens += line.split(b'#')[0].split()
+    magic, cols, rows = tokens[0], int(tokens[1]), int(tokens[2])
+    if magic not in (b'P1', b'P4'):
+        raise ValueError(f"Not a PBM bitmap (magic {magic!r})")
+    return magic, cols, rows
+
+
+def iter_pbm_rows(f):
+    """Yields bytearray rows from a binary PBM file (P1 or P4)."""
+    magic, cols, rows = _read_pbm_header(f)
+
+    if magic == b'P4':
+        row_bytes = (cols + 7) // 8
+        for r in range(rows):
+            packed = f.read(row_bytes)
+            if len(packed) != row_bytes:
+                raise ValueError(f"Truncated PBM data at row {r}")
+            yield bytearray(b''.join(_BITS_SET_IS_WALL[b] for b in packed)[:cols])
+        return
+
+    # P1: '0'/'1' digits, whitespace optional, '#' comments to end of line
+    digits = bytearray()
+    produced = 0
+    for line in f:
+        digits += bytes(line.split(b'#')[0].translate(None, b' \t\r\n\v\f')).translate(_P1_DIGITS)
+        while len(digits) >= cols and produced < rows:
+            yield digits[:cols]
+            del digits[:cols]
+            produced += 1
+    if produced < rows:
+        raise ValueError(f"Truncated PBM data at row {produced}")
+
+
+def read_pbm(filename):
+    with open(filename, 'rb') as f:
+        return list(iter_pbm_rows(f))
+
+
+def write_pbm(filename, maze, binary=True):
+    """Writes a P4 (binary, default) or P1 (text) bitmap; walls are black."""
+    rows, cols = len(maze), len(maze[0])
+    with open(filename, 'wb') as f:
+        f.write(b'P4\n' if binary else b'P1\n')
+        f.write(f"{cols} {rows}\n".encode())
+        for r, row in enumerate(maze):
+            row = bytes(row)
+            _check_width(row, cols, r)
+            if binary:
+                row += bytes(-cols % 8)  # Pad to whole bytes
+                f.write(bytes(_PACK_WALL_BITS[row[i:i + 8]] for i in range(0, len(row), 8)))
+            else:
+                f.write(row.translate(_CELL_TO_P1_DIGIT))
+                f.write(b'\n')
+
+
+# ---------------------------------------------------------
+# PNG
+# ---------------------------------------------------------
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Palette indices used when writing (2 bits per pixel)
+_PNG_OPEN, _PNG_WALL, _PNG_PATH, _PNG_END = 0, 1, 2, 3
+_PNG_PALETTE = bytes.fromhex('ECF0F1' '2C3E50' '9B59B6' 'E74C3C')  # Same colors as MazeApp
+_PNG_MARKS = {'.': _PNG_PATH, 'S': _PNG_END, 'E': _PNG_END}
+
+
+def _png_chunks(f):
+    """Yields (type, data) for each chunk, checking CRCs."""
+    if f.read(8) != PNG_SIGNATURE:
+        raise ValueError("Not a PNG file")
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            raise ValueError("Truncated PNG (no IEND chunk)")
+        length, kind = struct.unpack('>I4s', header)
+        data = f.read(length)
+        crc, = struct.unpack('>I', f.read(4))
+        if zlib.crc32(kind + data) != crc:
+            raise ValueError(f"Corrupt PNG chunk {kind!r}")
+        yield kind, data
+        if kind == b'IEND':
+            return
+
+
+def _unfilter(kind, line, prev, bpp):
+    """Undoes one scanline's PNG filter in place (prev is the previous raw line)."""
+    if kind == 0:
+        return
+    n = len(line)
+    if kind == 1:    # Sub
+        for i in range(bpp, n):
+            line[i] = (line[i] + line[i - bpp]) & 0xFF
+    elif kind == 2:  # Up
+        for i in range(n):
+            line[i] = (line[i] + prev[i]) & 0xFF
+    elif kind == 3:  # Average
+        for i in range(n):
+            left = line[i - bpp] if i >= bpp else 0
+            line[i] = (line[i] + ((left + prev[i]) >> 1)) & 0xFF
+    elif kind == 4:  # Paeth
+        for i in range(n):
+            a = line[i - bpp] if i >= bpp else 0
+            b = prev[i]
+            c = prev[i - bpp] if i >= bpp else 0
+            p = a + b - c
+            pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+            pred = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+            line[i] = (line[i] + pred) & 0xFF
+    else:
+        raise ValueError(f"Unknown PNG filter type {kind}")
+
+
+def _luminance(r, g, b):
+    return (299 * r + 587 * g + 114 * b) // 1000
+
+
+def _png_row_decoder(color_type, depth, cols, palette):
+    """Returns decode(raw_line) -> bytearray of cells for this pixel format."""
+    if depth < 8:
+        # Gray or palette samples packed several per byte
+        per_byte = 8 // depth
+        mask = (1 << depth) - 1
+        if color_type == 3:
+            wall_of = [_luminance(*palette[i * 3:i * 3 + 3]) < WALL_LUMINANCE if i * 3 < len(palette) else True
+                       for i in range(1 << depth)]
+        else:
+            wall_of = [(v * 255 // mask) < WALL_LUMINANCE for v in range(1 << depth)]
+        table = [bytes(wall_of[(b >> (8 - depth * (k + 1))) & mask] for k in range(per_byte)) for b in range(256)]
+        return lambda raw: bytearray(b''.join(table[b] for b in raw)[:cols])
+
+    step = depth // 8
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[color_type]
+    stride = channels * step
+    if color_type == 3:
+        lut = bytes(_luminance(*palette[i * 3:i * 3 + 3]) < WALL_LUMINANCE if i * 3 < len(palette) else 1
+                    for i in range(256))
+        return lambda raw: bytearray(raw.translate(lut))
+    if color_type in (0, 4):
+        lut = bytes(i < WALL_LUMINANCE for i in range(256))
+        return lambda raw: bytearray(bytes(raw[::stride]).translate(lut))  # High byte of the gray sample
+    # RGB / RGBA
+    return lambda raw: bytearray(
+        _luminance(raw[i], raw[i + step], raw[i + 2 * step]) < WALL_LUMINANCE for i in range(0, len(raw), stride))
+
+
+def iter_png_rows(f):
+    """Yields bytearray rows from a PNG, decompressing and unfiltering one scanline at a time."""
+    chunks = _png_chunks(f)
+    kind, data = next(chunks)
+    if kind != b'IHDR':
+        raise ValueError("PNG does not start with IHDR")
+    cols, rows, depth, color_type, _, _, interlace = struct.unpack('>IIBBBBB', data)
+    if interlace:
+        raise ValueError("Interlaced PNGs are not supported")
+    if color_type not in (0, 2, 3, 4, 6):
+        raise ValueError(f"Unsupported PNG color type {color_type}")
+
+    channels = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}[color_type]
+    bits_per_pixel = channels * depth
+    line_bytes = (cols * bits_per_pixel + 7) // 8
+    bpp = max(1, bits_per_pixel // 8)
+
+    palette = b''
+    decoder = None
+    inflater = zlib.decompressobj()
+    pending = bytearray()
+    prev = bytearray(line_bytes)
+    produced = 0
+
+    for kind, data in chunks:
+        if kind == b'PLTE':
+            palette = data
+        elif kind == b'IDAT':
+            if decoder is None:
+                decoder = _png_row_decoder(color_type, depth, cols, palette)
+            # Inflate at most one scanline at a time; a small IDAT can expand to
+            # the whole image, so the rest of the input waits in unconsumed_tail
+            while produced < rows:
+                out = inflater.decompress(data, line_bytes + 1)
+                data = inflater.unconsumed_tail
+                pending += out
+                while len(pending) > line_bytes and produced < rows:
+                    filter_type = pending[0]
+                    line = pending[1:line_bytes + 1]
+                    del pending[:line_bytes + 1]
+                    _unfilter(filter_type, line, prev, bpp)
+                    yield decoder(bytes(line))
+                    prev = line
+                    produced += 1
+                if not data and len(out) < line_bytes + 1:
+                    break  # This chunk is used up; inflate never had more output waiting
+
+    if produced < rows:
+        raise ValueError(f"Truncated PNG data at row {produced}")
+
+
+def read_png(filename):
+    with open(filename, 'rb') as f:
+        return list(iter_png_rows(f))
+
+
+def _write_chunk(f, kind, data):
+    f.write(struct.pack('>I', len(data)))
+    f.write(kind)
+    f.write(data)
+    f.write(struct.pack('>I', zlib.crc32(kind + data)))
+
+
+def write_png(filename, maze, path=None, start=None, goal=None, scale=1):
+    """
+    Writes a 2-bit palette PNG using the MazeApp colors; path cells and the
+    start/goal are drawn on top. scale repeats every cell scale x scale times.
+    """
+    overlay = _overlay_index(path, start, goal)
+    rows, cols = len(maze), len(maze[0])
+    width = cols * scale
+
+    with open(filename, 'wb') as f:
+        f.write(PNG_SIGNATURE)
+        _write_chunk(f, b'IHDR', struct.pack('>IIBBBBB', width, rows * scale, 2, 3, 0, 0, 0))
+        _write_chunk(f, b'PLTE', _PNG_PALETTE)
+
+        deflater = zlib.compressobj(6)
+        buffer = bytearray()
+        for r, row in enumerate(maze):
+            _check_width(row, cols, r)
+            pixels = bytearray(row)  # One row only: cells 0/1 are already palette indices
+            for c, mark in overlay.get(r, ()):
+                pixels[c] = _PNG_MARKS[mark]
+            if scale > 1:
+                pixels = bytearray(b''.join(bytes((p,)) * scale for p in pixels))
+            pixels = bytes(pixels) + bytes(-width % 4)  # Pad to whole bytes (4 pixels per byte)
+            packed = bytes(_PACK_2BIT[pixels[i:i + 4]] for i in range(0, len(pixels), 4))
+            line = b'\x00' + packed  # Filter type 0 (None)
+            for _ in range(scale):
+                buffer += deflater.compress(line)
+            if len(buffer) >= IDAT_CHUNK:
+                _write_chunk(f, b'IDAT', bytes(buffer))
+                buffer.clear()
+
+        buffer += deflater.flush()
+        _write_chunk(f, b'IDAT', bytes(buffer))
+        _write_chunk(f, b'IEND', b'')
+
+
+_PACK_2BIT = {
+    bytes((a, b, c, d)): (a << 6) | (b << 4) | (c << 2) | d
+    for a in range(4) for b in range(4) for c in range(4) for d in range(4)
+}
+
+
+# ---------------------------------------------------------
+# Dispatch by extension
+# ---------------------------------------------------------
+READERS = {'.txt': read_ascii, '.maze': read_ascii, '.pbm': read_pbm, '.png': read_png}
+PATH_FORMATS = ('.txt', '.maze', '.png')  # Formats save_maze can draw a path in
+
+
+def load_maze(filename):
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in READERS:
+        raise ValueError(f"Unknown maze format {ext!r}, expected one of {sorted(READERS)}")
+    return READERS[ext](filename)
+
+
+def save_maze(filename, maze, path=None, start=None, goal=None, scale=1):
+    ext = os.path.splitext(filename)[1].lower()
+    if path and ext not in PATH_FORMATS and ext in READERS:
+        raise ValueError(f"{ext} cannot show a path; write one of {PATH_FORMATS} to draw it")
+    if ext in ('.txt', '.maze'):
+        write_ascii(filename, maze, path, start, goal)
+    elif ext == '.pbm':
+        write_pbm(filename, maze)
+    elif ext == '.png':
+        write_png(filename, maze, path, start, goal, scale)
+    else:
+        raise ValueError(f"Unknown maze format {ext!r}, expected one of {sorted(READERS)}")
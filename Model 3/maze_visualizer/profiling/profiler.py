@@ -0,0 +1,197 @@
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from generator.maze_generator import generate_maze
+from algorithms.dfs import dfs_solve
+from algorithms.bfs import bfs_solve
+from algorithms.astar import astar_solve
+from algorithms.stats import SolveStats
+
+MODES = ("cprofile", "sampling")
+
+SOLVERS = {
+    "dfs": dfs_solve,
+    "bfs": bfs_solve,
+    "astar": astar_solve,
+}
+
+
+class Profiler:
+    """
+    Runs code under cProfile or a simple sampling profiler and records named
+    phases (generation, search, rendering, ...) along the way.
+
+        with Profiler("sampling") as prof:
+            with prof.phase("search"):
+                ...
+        prof.write("profiles/run")
+
+    write() produces <prefix>.pstats (cProfile mode) and <prefix>.trace.json,
+    a Chrome trace that also opens in speedscope and chrome://tracing.
+    Phases go on their own track and sampled call stacks on a second one, so
+    the hot paths line up with the phases. The sampler runs in both modes;
+    in cProfile mode the stacks are taken from the (slower) profiled run.
+    """
+
+    def __init__(self, mode="cprofile", interval=0.001):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode {mode!r}, expected one of {MODES}")
+        self.mode = mode
+        self.interval = interval
+        self.phases = []   # (name, start, end, args) in perf_counter seconds
+        self.samples = []  # (time, stack) with the stack listed root first
+        self._open = {}
+        self._profile = None
+        self._sampler = None
+        self._stop = threading.Event()
+
+    # --- Start / stop ---
+    def start(self):
+        self.t0 = time.perf_counter()
+        self._target = threading.get_ident()
+        # Let the sampler thread grab the GIL at least once per interval
+        self._old_switch = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._old_switch, self.interval / 2))
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+        self._sampler.start()
+        if self.mode == "cprofile":
+            self._profile = cProfile.Profile()  # Only profiles this thread, not the sampler
+            self._profile.enable()
+        return self
+
+    def stop(self):
+        if self.mode == "cprofile":
+            self._profile.disable()
+        self._stop.set()
+        self._sampler.join()
+        sys.setswitchinterval(self._old_switch)
+        self.t1 = time.perf_counter()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    # --- Phases ---
+    def begin(self, name):
+        self._open[name] = time.perf_counter()
+
+    def end(self, name):
+        self.add_phase(name, self._open.pop(name), time.perf_counter())
+
+    @contextmanager
+    def phase(self, name):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def add_phase(self, name, start, end, args=None):
+        """args: optional dict shown with the phase in the trace viewer."""
+        self.phases.append((name, start, end, args))
+
+    def add_solve_phases(self, start, stats):
+        """
+        Adds search/reconstruction phases from a filled SolveStats, starting at
+        start. Trace recording happens inside the search loop, so it is not a
+        phase of its own: its estimated share is attached to the search phase.
+        """
+        search_end = start + stats.search_time + stats.trace_time
+        self.add_phase("search", start, search_end,
+                       {"trace recording ms (estimated, included)": stats.trace_time * 1000})
+        self.add_phase("reconstruction", search_end, search_end + stats.reconstruct_time)
+
+    # --- Sampling ---
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stack.reverse()
+            self.samples.append((time.perf_counter(), tuple(stack)))
+
+    # --- Output ---
+    def trace_events(self):
+        """Builds the Chrome trace event list (timestamps in microseconds from start)."""
+        def us(t):
+            return (t - self.t0) * 1e6
+
+        events = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": f"maze profile ({self.mode})"}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "phases"}},
+        ]
+        for name, start, end, args in sorted(self.phases, key=lambda p: (p[1], -p[2])):
+            event = {"name": name, "cat": "phase", "ph": "X", "pid": 1, "tid": 1,
+                     "ts": us(start), "dur": us(end) - us(start)}
+            if args:
+                event["args"] = args
+            events.append(event)
+
+        if self.samples:
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": 2, "args": {"name": "samples"}})
+            # Merge consecutive samples that share a stack prefix into one slice per frame
+            open_frames = []  # (label, start_time)
+            for t, stack in self.samples + [(self.t1, ())]:
+                common = 0
+                while (common < len(open_frames) and common < len(stack)
+                       and open_frames[common][0] == stack[common]):
+                    common += 1
+                for label, start in reversed(open_frames[common:]):
+                    events.append({"name": label, "cat": "sample", "ph": "X", "pid": 1, "tid": 2,
+                                   "ts": us(start), "dur": us(t) - us(start)})
+                del open_frames[common:]
+                open_frames.extend((label, t) for label in stack[common:])
+        return events
+
+    def write(self, prefix):
+        """Writes the profile files next to prefix and returns their paths."""
+        folder = os.path.dirname(prefix)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        written = []
+        if self._profile is not None:
+            self._profile.dump_stats(prefix + ".pstats")
+            written.append(prefix + ".pstats")
+
+        with open(prefix + ".trace.json", "w") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+        written.append(prefix + ".trace.json")
+        return written
+
+
+# ---------------------------------------------------------
+# Ready-made targets (used by the benchmark CLI)
+# ---------------------------------------------------------
+def profile_generation(rows, cols, density=0.05, seed=None, mode="cprofile", interval=0.001):
+    """Generates one maze under the profiler. Returns (maze, profiler)."""
+    with Profiler(mode, interval) as prof:
+        with prof.phase("generation"):
+            maze = generate_maze(rows, cols, density, seed=seed, phases=prof)
+    return maze, prof
+
+
+def profile_solve(maze, algo, start, goal, mode="cprofile", interval=0.001):
+    """Runs one solver (a SOLVERS key) under the profiler. Returns (result, stats, profiler)."""
+    solver = SOLVERS[algo]
+    stats = SolveStats()
+    with Profiler(mode, interval) as prof:
+        t = time.perf_counter()
+        result = solver(maze, start, goal, stats)
+    stats.estimate_trace_time(result[0])
+    prof.add_solve_phases(t, stats)
+    return result, stats, prof
@@ -0,0 +1,83 @@
+import asyncio
+import itertools
+import json
+
+from service.server import MAX_LINE
+
+
+class SolveError(Exception):
+    pass
+
+
+class SolveClient:
+    """
+    Asyncio client for the solve service. Requests can be issued concurrently;
+    responses are matched to them by id.
+
+        client = await SolveClient.connect("/tmp/maze_solver.sock")
+        maze_id = await client.generate(101, 101, seed=1)
+        path = await client.solve(maze_id, (0, 0), (100, 100))
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.ids = itertools.count()
+        self.waiting = {}  # request id -> future
+        self.reader_task = asyncio.create_task(self._read_loop())
+
+    @classmethod
+    async def connect(cls, socket_path="/tmp/maze_solver.sock"):
+        reader, writer = await asyncio.open_unix_connection(socket_path, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.reader_task.cancel()
+
+    async def request(self, **msg):
+        """Sends one request and returns the raw response (raises SolveError on errors)."""
+        msg["id"] = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[msg["id"]] = future
+        self.writer.write((json.dumps(msg) + "\n").encode())
+        await self.writer.drain()
+        response = await future
+        if "error" in response:
+            raise SolveError(response["error"])
+        return response
+
+    async def _read_loop(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            future = self.waiting.pop(response.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+        for future in self.waiting.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Solve service closed the connection"))
+
+    # --- Convenience wrappers ---
+    async def load(self, maze):
+        return (await self.request(op="load", maze=maze))["maze_id"]
+
+    async def generate(self, rows, cols, density=0.05, seed=None):
+        return (await self.request(op="generate", rows=rows, cols=cols, density=density, seed=seed))["maze_id"]
+
+    async def solve(self, maze_id, start, goal, algo="bfs"):
+        path = (await self.request(op="solve", maze_id=maze_id, start=start, goal=goal, algo=algo))["path"]
+        return [tuple(cell) for cell in path] if path else None
+
+    async def nearest(self, maze_id, starts, goals):
+        response = await self.request(op="nearest", maze_id=maze_id, starts=starts, goals=goals)
+        if response["pair"] is None:
+            return None, None
+        pair = tuple(tuple(cell) for cell in response["pair"])
+        return pair, [tuple(cell) for cell in response["path"]]
+
+    async def stats(self):
+        return await self.request(op="stats")
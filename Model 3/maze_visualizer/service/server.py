@@ -0,0 +1,481 @@
+"""
+Local solve service: keeps mazes in memory and answers solve requests over a
+Unix domain socket, so tools don't have to import the solvers and regenerate
+mazes in every process.
+
+Run from the maze_visualizer folder:
+    python -m service.server --socket /tmp/maze_solver.sock --workers 4
+
+Protocol: one JSON object per line in each direction. Every request may carry
+an "id", which is echoed in its response (responses can arrive out of order).
+    {"op": "load", "maze": [[0, 1, ...], ...]}           -> {"maze_id": ...}
+    {"op": "generate", "rows": 101, "cols": 101, "density": 0.05, "seed": 1}
+                                                         -> {"maze_id": ...}
+    {"op": "solve", "maze_id": ..., "start": [0, 0], "goal": [10, 10], "algo": "bfs"}
+                                                         -> {"path": [[r, c], ...] or null}
+    {"op": "nearest", "maze_id": ..., "starts": [...], "goals": [...]}
+                                                         -> {"pair": ..., "path": ...}
+    {"op": "unload", "maze_id": ...}
+    {"op": "stats"}                                      -> latency and batching metrics
+Failures come back as {"error": "..."}; "overloaded" means the request was
+rejected by backpressure and can be retried later.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import statistics
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from generator.maze_generator import generate_maze
+from algorithms.dfs import dfs_solve
+from algorithms.astar import astar_solve
+from algorithms.multi import multi_bfs_solve
+from algorithms.path_utils import reconstruct_path
+
+ALGORITHMS = ("bfs", "astar", "dfs")
+MAX_LINE = 256 * 1024 * 1024  # Large enough for a "load" of a big maze
+
+
+# ---------------------------------------------------------
+# CPU work (runs in the process pool)
+# ---------------------------------------------------------
+_worker_mazes = {}  # maze_id -> decoded maze, per worker process
+WORKER_MAZE_CACHE = 4
+
+
+def encode_maze(maze):
+    """Returns (rows, cols, grid bytes, maze_id); maze_id is a hash of the contents."""
+    rows, cols = len(maze), len(maze[0])
+    grid = bytearray()
+    for r, row in enumerate(maze):
+        if len(row) != cols:
+            raise ValueError(f"Row {r} has {len(row)} cells, expected {cols}")
+        grid += bytes(1 if cell else 0 for cell in row)
+    maze_id = hashlib.sha256(f"{rows}x{cols}:".encode() + grid).hexdigest()[:16]
+    return rows, cols, grid, maze_id
+
+
+def _decode(maze_id, rows, cols, shm_name):
+    """
+    Rebuilds the maze (rows of bytearray) from the server's shared memory block
+    once per worker and keeps the latest few, so a batch only carries the
+    block's name, never the grid itself.
+    """
+    maze = _worker_mazes.pop(maze_id, None)
+    if maze is None:
+        try:
+            shm = SharedMemory(name=shm_name)
+        except FileNotFoundError:
+            raise KeyError(f"Maze {maze_id!r} was unloaded") from None
+        try:
+            maze = [bytearray(shm.buf[r * cols:(r + 1) * cols]) for r in range(rows)]
+        finally:
+            shm.close()
+        if len(_worker_mazes) >= WORKER_MAZE_CACHE:
+            del _worker_mazes[next(iter(_worker_mazes))]
+    _worker_mazes[maze_id] = maze  # Re-insert as most recently used
+    return maze
+
+
+def _bfs_to_goals(maze, start, goals):
+    """
+    One BFS from start that stops once every goal has been reached.
+    Neighbor order and parents match bfs_solve, so each path is the one
+    bfs_solve would return for that goal.
+    """
+    rows = len(maze)
+    cols = len(maze[0])
+    remaining = set(goals)
+    remaining.discard(start)
+    visited = {start}
+    parent = {}
+    q = deque([start])
+
+    while q and remaining:
+        r, c = q.popleft()
+        for nr, nc in [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]:
+            neighbor = (nr, nc)
+            if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] == 0 and neighbor not in visited:
+                visited.add(neighbor)
+                parent[neighbor] = (r, c)
+                q.append(neighbor)
+                remaining.discard(neighbor)
+
+    return {goal: reconstruct_path(parent, start, goal) for goal in goals}
+
+
+def _error(e):
+    return f"{type(e).__name__}: {e}"
+
+
+def solve_batch(maze_id, rows, cols, shm_name, queries):
+    """
+    Answers a batch of (algo, start, goal) queries against one maze.
+    All BFS queries that share a start are answered by a single search.
+    Returns (path, error) pairs in query order; a query that fails only gets
+    its own error, the rest of the batch (often other clients) is unaffected.
+    """
+    maze = _decode(maze_id, rows, cols, shm_name)
+    results = [None] * len(queries)
+
+    by_start = {}
+    for i, (algo, start, goal) in enumerate(queries):
+        try:
+            if algo == "bfs":
+                by_start.setdefault(start, []).append(i)
+            elif algo == "astar":
+                results[i] = (astar_solve(maze, start, goal)[1], None)
+            else:
+                results[i] = (dfs_solve(maze, start, goal)[1], None)
+        except Exception as e:
+            results[i] = (None, _error(e))
+
+    for start, indices in by_start.items():
+        try:
+            paths = _bfs_to_goals(maze, start, [queries[i][2] for i in indices])
+        except Exception:
+            # Find out which goals are at fault by answering them one at a time
+            paths = {}
+            for i in indices:
+                goal = queries[i][2]
+                try:
+                    paths.update(_bfs_to_goals(maze, start, [goal]))
+                except Exception as e:
+                    results[i] = (None, _error(e))
+        for i in indices:
+            if results[i] is None:
+                results[i] = (paths[queries[i][2]], None)
+    return results
+
+
+def solve_nearest(maze_id, rows, cols, shm_name, starts, goals):
+    maze = _decode(maze_id, rows, cols, shm_name)
+    _, pair, path, _ = multi_bfs_solve(maze, starts, goals)
+    return pair, path
+
+
+# ---------------------------------------------------------
+# Server
+# ---------------------------------------------------------
+def _cell(value, name, rows, cols):
+    """Checks that a request field is an [r, c] pair inside the maze and returns it as a tuple."""
+    if (not isinstance(value, (list, tuple)) or len(value) != 2
+            or not all(isinstance(v, int) and not isinstance(v, bool) for v in value)):
+        raise ValueError(f"{name} must be [row, col] integers, got {value!r}")
+    r, c = value
+    if not (0 <= r < rows and 0 <= c < cols):
+        raise ValueError(f"{name} {value!r} is outside the {rows}x{cols} maze")
+    return (r, c)
+
+
+def _cells(values, name, rows, cols):
+    if not isinstance(values, list) or not values:
+        raise ValueError(f"{name} must be a non-empty list of [row, col] pairs")
+    return [_cell(value, f"{name}[{i}]", rows, cols) for i, value in enumerate(values)]
+
+
+class Overloaded(Exception):
+    pass
+
+
+class QueryError(Exception):
+    """A single batched query failed; the message is already formatted for the client."""
+
+
+class SolveServer:
+    """
+    Holds mazes by id (a hash of their contents) and batches solve requests.
+    Each maze is copied into shared memory once when it is loaded; workers
+    attach to it by name.
+    Requests for the same maze that arrive within batch_window seconds of each
+    other (up to max_batch of them) are sent to the process pool as one task.
+
+    Backpressure: each connection has at most max_inflight requests in flight
+    (we stop reading from it until one finishes), and once max_pending solve
+    requests are queued server-wide new ones are rejected as "overloaded".
+    """
+
+    def __init__(self, socket_path, workers=None, batch_window=0.002, max_batch=256,
+                 max_pending=10000, max_inflight=64):
+        self.socket_path = socket_path
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.max_inflight = max_inflight
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.mazes = {}    # maze_id -> (rows, cols, SharedMemory holding the grid)
+        self.batches = {}  # maze_id -> [(query, future), ...] waiting to be flushed
+        self.pending = 0
+        self.server = None
+
+        # Metrics
+        self.latencies = deque(maxlen=10000)  # Seconds, most recent requests
+        self.requests = 0
+        self.rejected = 0
+        self.batch_count = 0
+        self.batched_queries = 0
+
+    # --- Lifecycle ---
+    async def start(self):
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)  # Stale socket from a previous run
+        self.server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path, limit=MAX_LINE)
+        return self
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for maze_id in list(self.mazes):
+            self.unload(maze_id)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    # --- Connections ---
+    async def _handle_client(self, reader, writer):
+        inflight = asyncio.Semaphore(self.max_inflight)
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        reset = False
+
+        try:
+            while True:
+                await inflight.acquire()  # Stop reading while too much is in flight
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than MAX_LINE (readline wraps LimitOverrunError). The next
+                    # request boundary is lost, so answer what is in flight and hang up
+                    await self._send(writer, write_lock, {"id": None, "error": f"Request longer than {MAX_LINE} bytes"})
+                    break
+                except ConnectionError:
+                    reset = True
+                    break
+                if not line:
+                    break
+                task = asyncio.create_task(self._respond(line, writer, write_lock, inflight))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks and not reset:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass  # Client went away while we were answering it
+        finally:
+            # Nobody is left to read the answers of whatever is still running
+            pending = list(tasks)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            writer.close()
+
+    async def _send(self, writer, write_lock, response):
+        if writer.is_closing():
+            return  # Client is gone; nothing to answer
+        async with write_lock:
+            writer.write((json.dumps(response) + "\n").encode())
+            await writer.drain()
+
+    async def _respond(self, line, writer, write_lock, inflight):
+        t0 = time.perf_counter()
+        request_id = None
+        try:
+            msg = json.loads(line)
+            request_id = msg.get("id")
+            response = await self._dispatch(msg)
+        except Overloaded:
+            self.rejected += 1
+            response = {"error": "overloaded"}
+        except QueryError as e:
+            response = {"error": str(e)}
+        except Exception as e:  # Report the problem to the client instead of dropping it
+            response = {"error": f"{type(e).__name__}: {e}"}
+        finally:
+            inflight.release()
+
+        latency = time.perf_counter() - t0
+        self.requests += 1
+        self.latencies.append(latency)
+        response["id"] = request_id
+        response["latency_ms"] = latency * 1000
+        await self._send(writer, write_lock, response)
+
+    async def _dispatch(self, msg):
+        op = msg.get("op")
+        if op == "solve":
+            algo = msg.get("algo", "bfs")
+            if algo not in ALGORITHMS:
+                raise ValueError(f"Unknown algorithm {algo!r}, expected one of {ALGORITHMS}")
+            rows, cols, _ = self._maze(msg["maze_id"])
+            start = _cell(msg.get("start"), "start", rows, cols)
+            goal = _cell(msg.get("goal"), "goal", rows, cols)
+            path, batch_size = await self.solve(msg["maze_id"], start, goal, algo)
+            return {"path": path, "batch_size": batch_size}
+        if op == "nearest":
+            rows, cols, _ = self._maze(msg["maze_id"])
+            starts = _cells(msg.get("starts"), "starts", rows, cols)
+            goals = _cells(msg.get("goals"), "goals", rows, cols)
+            pair, path = await self.nearest(msg["maze_id"], starts, goals)
+            return {"pair": pair, "path": path}
+        if op == "load":
+            return {"maze_id": await self.load(msg["maze"])}
+        if op == "generate":
+            loop = asyncio.get_running_loop()
+            maze = await loop.run_in_executor(
+                self.executor, generate_maze,
+                msg["rows"], msg["cols"], msg.get("density", 0.05), msg.get("seed"))
+            return {"maze_id": await self.load(maze), "rows": len(maze), "cols": len(maze[0])}
+        if op == "unload":
+            return {"removed": self.unload(msg["maze_id"])}
+        if op == "stats":
+            return self.stats()
+        raise ValueError(f"Unknown op {op!r}")
+
+    # --- Mazes ---
+    async def load(self, maze):
+        # Encoding and hashing a big maze takes a while; keep it off the event loop
+        rows, cols, grid, maze_id = await asyncio.to_thread(encode_maze, maze)
+        if maze_id not in self.mazes:
+            shm = SharedMemory(create=True, size=max(1, len(grid)))
+            shm.buf[:len(grid)] = grid
+            self.mazes[maze_id] = (rows, cols, shm)
+        return maze_id
+
+    def unload(self, maze_id):
+        entry = self.mazes.pop(maze_id, None)
+        if entry is None:
+            return False
+        shm = entry[2]
+        shm.close()
+        shm.unlink()
+        return True
+
+    def _maze(self, maze_id):
+        try:
+            return self.mazes[maze_id]
+        except KeyError:
+            raise KeyError(f"Unknown maze_id {maze_id!r}; load it first") from None
+
+    # --- Batching ---
+    async def solve(self, maze_id, start, goal, algo="bfs"):
+        """Queues one query in its maze's batch. Returns (path, batch_size)."""
+        self._maze(maze_id)
+        if self.pending >= self.max_pending:
+            raise Overloaded()
+
+        future = asyncio.get_running_loop().create_future()
+        batch = self.batches.setdefault(maze_id, [])
+        batch.append(((algo, start, goal), future))
+        self.pending += 1
+
+        if len(batch) == 1:
+            asyncio.get_running_loop().call_later(self.batch_window, self._flush, maze_id, batch)
+        if len(batch) >= self.max_batch:
+            self._flush(maze_id, batch)
+
+        try:
+            return await future
+        finally:
+            self.pending -= 1
+
+    def _flush(self, maze_id, batch):
+        if self.batches.get(maze_id) is not batch:
+            return  # Already flushed (it filled up before the timer fired)
+        del self.batches[maze_id]
+        asyncio.create_task(self._run_batch(maze_id, batch))
+
+    async def _run_batch(self, maze_id, batch):
+        queries = [query for query, _ in batch]
+        self.batch_count += 1
+        self.batched_queries += len(batch)
+        try:
+            rows, cols, shm = self._maze(maze_id)
+            loop = asyncio.get_running_loop()
+            paths = await loop.run_in_executor(self.executor, solve_batch, maze_id, rows, cols, shm.name, queries)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), (path, error) in zip(batch, paths):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(QueryError(error))
+            else:
+                future.set_result((path, len(batch)))
+
+    async def nearest(self, maze_id, starts, goals):
+        rows, cols, shm = self._maze(maze_id)
+        if self.pending >= self.max_pending:
+            raise Overloaded()
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, solve_nearest, maze_id, rows, cols, shm.name, starts, goals)
+        finally:
+            self.pending -= 1
+
+    # --- Metrics ---
+    def stats(self):
+        latencies = sorted(self.latencies)
+
+        def pct(p):
+            return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000 if latencies else None
+
+        return {
+            "mazes": len(self.mazes),
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "pending": self.pending,
+            "batches": self.batch_count,
+            "avg_batch_size": self.batched_queries / self.batch_count if self.batch_count else None,
+            "latencies_ms": {
+                "mean": statistics.fmean(latencies) * 1000 if latencies else None,
+                "p50": pct(50),
+                "p95": pct(95),
+                "p99": pct(99),
+                "max": latencies[-1] * 1000 if latencies else None,
+            },
+        }
+
+
+async def _main(args):
+    server = await SolveServer(
+        args.socket, workers=args.workers, batch_window=args.batch_window_ms / 1000,
+        max_batch=args.max_batch, max_pending=args.max_pending, max_inflight=args.max_inflight,
+    ).start()
+    print(f"Solve service listening on {args.socket}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve maze solves over a Unix domain socket.")
+    parser.add_argument("--socket", default="/tmp/maze_solver.sock")
+    parser.add_argument("--workers", type=int, default=None, help="Solver processes (default: CPU count)")
+    parser.add_argument("--batch-window-ms", type=float, default=2.0)
+    parser.add_argument("--max-batch", type=int, default=256)
+    parser.add_argument("--max-pending", type=int, default=10000)
+    parser.add_argument("--max-inflight", type=int, default=64, help="Per-connection requests in flight")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,29 @@
 import tkinter as tk
 from tkinter import ttk
+import os
 import time
 
 # Import all necessary modules
 from generator.maze_generator import generate_maze
+from generator.maze_pool import MazePool
 from algorithms.dfs import dfs_solve
 from algorithms.bfs import bfs_solve
 from algorithms.astar import astar_solve
+from algorithms.stats import SolveStats
+from profiling.profiler import Profiler
 
 
 class MazeApp:
-    def __init__(self, rows=31, cols=31, cell_size=20):
+    def __init__(self, rows=31, cols=31, cell_size=20, density=0.05, pool_size=3):
         self.root = tk.Tk()
         self.root.title("Maze Solver Visualizer")
 
         # --- Configuration ---
-        self.rows = rows
-        self.cols = cols
+        # Rounded once here so the maze pool and every generate use the same size
+        self.rows = int(rows / 2) * 2 + 1 # Ensure odd
+        self.cols = int(cols / 2) * 2 + 1
         self.cell_size = cell_size
+        self.density = density
         self.maze = []
         self.rect_ids = []
         
@@ -34,7 +40,7 @@ class MazeApp:
         # --- UI Setup ---
         
         # 1. Main Canvas
-        self.canvas = tk.Canvas(self.root, width=cols * cell_size, height=rows * cell_size, bg=self.colors['wall'])
+        self.canvas = tk.Canvas(self.root, width=self.cols * cell_size, height=self.rows * cell_size, bg=self.colors['wall'])
         self.canvas.pack(padx=10, pady=10)
 
         # 2. Controls Frame
@@ -56,6 +62,12 @@ class MazeApp:
         speed_label.pack(side=tk.LEFT, padx=10)
         self.speed_slider.pack(side=tk.LEFT, padx=5)
 
+        # Profiling mode (traces are written to ./profiles)
+        self.profile_modes = {'Off': None, 'cProfile': 'cprofile', 'Sampling': 'sampling'}
+        self.profile_var = tk.StringVar(value='Off')
+        ttk.Label(control_frame, text="Profile:").pack(side=tk.LEFT, padx=5)
+        ttk.OptionMenu(control_frame, self.profile_var, 'Off', *self.profile_modes).pack(side=tk.LEFT, padx=5)
+
         # 5. Buttons
         ttk.Button(control_frame, text="Generate New Maze", command=self.generate_new_maze).pack(side=tk.LEFT, padx=10)
         ttk.Button(control_frame, text="Solve Maze", command=lambda: self.solve_maze(self.algo_var.get())).pack(side=tk.LEFT, padx=10)
@@ -63,21 +75,56 @@ class MazeApp:
         # 6. Status Label
         self.time_label = ttk.Label(self.root, text="Actual Solve Time: N/A")
         self.time_label.pack(pady=5)
+        self.stats_label = ttk.Label(self.root, text="")
+        self.stats_label.pack(pady=5)
+        self.profile_label = ttk.Label(self.root, text="")
+        self.profile_label.pack(pady=5)
 
         # --- Initial Setup ---
+        # Background workers keep a few mazes ready so "Generate New Maze" is instant
+        self.maze_pool = MazePool(self.rows, self.cols, self.density, size=pool_size)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         self.generate_new_maze()
         
         # Start main loop
         self.root.mainloop()
 
+    def close(self):
+        """Stops the maze pool workers and closes the window."""
+        self.maze_pool.shutdown()
+        self.root.destroy()
+
     def generate_new_maze(self):
         """Generates a new maze and resets the UI state."""
-        self.rows = int(self.rows / 2) * 2 + 1 # Ensure odd
-        self.cols = int(self.cols / 2) * 2 + 1
-        self.maze = generate_maze(self.rows, self.cols)
+        profiler = self.start_profiler()
+        if profiler is None:
+            self.maze = self.maze_pool.get(self.rows, self.cols, self.density)
+        else:
+            # Generate in this process so the profiler can see the work
+            with profiler.phase("generation"):
+                self.maze = generate_maze(self.rows, self.cols, self.density, phases=profiler)
         self.rect_ids = [[None for _ in range(self.cols)] for _ in range(self.rows)]
-        self.draw_grid()
+        if profiler is None:
+            self.draw_grid()
+        else:
+            with profiler.phase("rendering"):
+                self.draw_grid()
+            self.finish_profiler(profiler, "generate")
         self.time_label.config(text="Actual Solve Time: N/A")
+        self.stats_label.config(text="")
+
+    def start_profiler(self):
+        """Returns a running Profiler if a profiling mode is selected, otherwise None."""
+        mode = self.profile_modes[self.profile_var.get()]
+        return Profiler(mode).start() if mode else None
+
+    def finish_profiler(self, profiler, name):
+        """Stops the profiler and writes its files to ./profiles."""
+        profiler.stop()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        prefix = os.path.join("profiles", f"{name}_{self.rows}x{self.cols}_{profiler.mode}_{stamp}")
+        written = profiler.write(prefix)
+        self.profile_label.config(text="Profile written to " + ", ".join(written))
 
     # --- Methods provided by the user (with class context added) ---
     def solve_maze(self, algo):
@@ -85,24 +132,40 @@ class MazeApp:
         Solves the maze using the selected algorithm and starts the animation.
         This block uses the user's provided logic for algorithm execution.
         """
+        profiler = self.start_profiler()
+
         # Reset state and visualization
-        self.draw_grid()
+        if profiler is None:
+            self.draw_grid()
+        else:
+            with profiler.phase("rendering"):
+                self.draw_grid()
         self.time_label.config(text="Actual Solve Time: Computing...")
+        self.stats_label.config(text="")
         
         start = (0, 0)
         goal = (self.rows - 1, self.cols - 1)
+        stats = SolveStats()
+        solve_start = time.perf_counter()
 
         # Choose algorithm
         if algo == 'DFS':
-            steps, path, real_time = dfs_solve(self.maze, start, goal)
+            steps, path, real_time = dfs_solve(self.maze, start, goal, stats)
         elif algo == 'BFS':
-            steps, path, real_time = bfs_solve(self.maze, start, goal)
+            steps, path, real_time = bfs_solve(self.maze, start, goal, stats)
         else: # Default or A*
-            steps, path, real_time = astar_solve(self.maze, start, goal)
+            steps, path, real_time = astar_solve(self.maze, start, goal, stats)
+
+        stats.estimate_trace_time(steps)  # After the solve, so real_time is unaffected
 
         self.steps = steps
         self.path = path
         self.solve_time = real_time
+        self.solve_stats = stats
+
+        if profiler is not None:
+            profiler.add_solve_phases(solve_start, stats)
+            self.finish_profiler(profiler, algo.replace('*', 'star').lower())
 
         # Start animating the recorded steps
         self.anim_index = 0
@@ -175,4 +238,5 @@ class MazeApp:
                 self.canvas.itemconfig(self.rect_ids[self.rows - 1][self.cols - 1], fill=self.colors['goal'])
                 
             # show real solve time
-            self.time_label.config(text=f"Actual Solve Time: {self.solve_time:.6f} seconds")
\ No newline at end of file
+            self.time_label.config(text=f"Actual Solve Time: {self.solve_time:.6f} seconds")
+            self.stats_label.config(text=self.solve_stats.summary())
\ No newline at end of file